@@ -77,7 +77,7 @@ def cli(ctx, output_format, platform, config_dir, debug, version):
 
         if ctx.obj.debug:
             logger = ctx.obj.get_logger()
-            logger.debug(f"Using custom config directory: {config_dir}")
+            logger.debug("Using custom config directory: %s", config_dir)
 
         init_config(Path(config_dir))
         ctx.obj.config = get_config()
@@ -94,9 +94,9 @@ def cli(ctx, output_format, platform, config_dir, debug, version):
 
     if ctx.obj.debug:
         logger = ctx.obj.get_logger()
-        logger.debug(f"Output format: {ctx.obj.output_format}")
-        logger.debug(f"Default platform: {ctx.obj.platform}")
-        logger.debug(f"Config loaded from: {ctx.obj.config.config_dir}")
+        logger.debug("Output format: %s", ctx.obj.output_format)
+        logger.debug("Default platform: %s", ctx.obj.platform)
+        logger.debug("Config loaded from: %s", ctx.obj.config.config_dir)
 
 
 @cli.group()
@@ -0,0 +1,128 @@
+"""In-process response cache for git-mcp."""
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Async-aware TTL cache with single-flight loading.
+
+    Entries expire ``ttl`` seconds after they are stored and the least recently
+    used entry is evicted once ``maxsize`` is reached. Concurrent lookups of a
+    missing key share one in-flight load instead of each calling the loader.
+
+    Every entry carries an optional ``scope`` (e.g. a project ID) so mutations
+    can drop only the entries that may be affected by them. Loads still in
+    flight when their scope is invalidated are not stored, and later lookups
+    start a fresh load instead of joining them.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, Optional[str], Any]] = (
+            OrderedDict()
+        )
+        self._inflight: Dict[Hashable, Tuple[asyncio.Future, Optional[str]]] = {}
+        # Invalidation counters, compared before and after each load
+        self._generation = 0
+        self._scope_generations: Dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        ttl: float,
+        loader: Callable[[], Awaitable[Any]],
+        scope: Optional[str] = None,
+        should_store: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        ``should_store`` can reject results that must not be cached, such as
+        error payloads. Values are deep-copied on the way out so callers can
+        mutate results without corrupting the cache.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return copy.deepcopy(value)
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return copy.deepcopy(await asyncio.shield(inflight[0]))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = (future, scope)
+        started = self._generations(scope)
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            # Skip values that a write may have made stale while loading
+            if self._generations(scope) == started and (
+                should_store is None or should_store(value)
+            ):
+                self._store(key, ttl, scope, value)
+            return copy.deepcopy(value)
+        finally:
+            if self._inflight.get(key, (None,))[0] is future:
+                del self._inflight[key]
+
+    def invalidate(self, scope: Optional[str] = None) -> None:
+        """Drop cached entries stored under ``scope``, or every entry if omitted.
+
+        Unscoped entries are only dropped when no scope is given.
+        """
+        if scope is None:
+            self.clear()
+            return
+        self.invalidate_where(lambda entry_scope: entry_scope == scope)
+
+    def invalidate_where(self, predicate: Callable[[Optional[str]], bool]) -> None:
+        """Drop cached entries and in-flight loads whose scope satisfies ``predicate``."""
+        scopes = set()
+        for key, (_, entry_scope, _) in list(self._entries.items()):
+            if predicate(entry_scope):
+                scopes.add(entry_scope)
+                del self._entries[key]
+        for key, (_, entry_scope) in list(self._inflight.items()):
+            if predicate(entry_scope):
+                scopes.add(entry_scope)
+                del self._inflight[key]
+        for scope in scopes:
+            self._scope_generations[scope] = self._scope_generations.get(scope, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all cached entries and in-flight loads."""
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+    def _generations(self, scope: Optional[str]) -> Tuple[int, int]:
+        return self._generation, self._scope_generations.get(scope, 0)
+
+    def _store(
+        self, key: Hashable, ttl: float, scope: Optional[str], value: Any
+    ) -> None:
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, scope, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,349 @@
+"""Concurrency and rate limits for outbound platform calls."""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Tuple
+
+from .config import get_config
+
+DEFAULT_MAX_CONCURRENCY = 10
+# MCP tool calls per minute, not HTTP requests: one call can page through many
+# API requests, so no fixed call rate maps onto a platform's request quota.
+# Off by default; throttling responses shrink the concurrency limit instead.
+DEFAULT_RATE_LIMIT = 0
+
+# AIMD tuning: each successful call grows the adaptive limit by
+# ADDITIVE_INCREASE slots, each throttled call multiplies it by
+# MULTIPLICATIVE_DECREASE. It never exceeds the configured limit.
+ADDITIVE_INCREASE = 0.5
+MULTIPLICATIVE_DECREASE = 0.5
+# Status codes that mean the platform wants us to slow down
+THROTTLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class AdmissionController:
+    """Resizable concurrency limit.
+
+    Unlike ``asyncio.Semaphore`` the limit can be changed while calls are in
+    flight. Lowering it lets running calls finish and holds back new ones
+    until the active count drops below the new limit.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = max(1, limit)
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit and wake waiters so they re-check it."""
+        async with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+
+class TokenBucket:
+    """Token bucket limiting calls to ``rate`` per minute.
+
+    The bucket holds up to a minute's worth of tokens, so short bursts run
+    immediately while sustained load is smoothed to the configured rate.
+    Waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate: int):
+        self._rate = max(1, rate)
+        self._tokens = float(self._rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> int:
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._rate, self._tokens + (now - self._updated) * self._rate / 60
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * 60 / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def set_rate(self, rate: int) -> None:
+        """Change the rate, keeping the tokens accumulated so far."""
+        self._refill()
+        self._rate = max(1, rate)
+        self._tokens = min(self._tokens, self._rate)
+
+
+# Per-platform controllers together with the event loop they were created in
+_controllers: Dict[str, Tuple[asyncio.AbstractEventLoop, AdmissionController]] = {}
+# Limits set at runtime, taking precedence over GIT_MCP_MAX_CONCURRENCY
+_limit_overrides: Dict[str, int] = {}
+# Per-platform rate limiters together with the event loop they were created in
+_buckets: Dict[str, Tuple[asyncio.AbstractEventLoop, TokenBucket]] = {}
+# Rates set at runtime, taking precedence over GIT_MCP_RATE_LIMIT
+_rate_overrides: Dict[str, int] = {}
+# Adaptive limits of platforms that throttled us and have not recovered yet
+_adaptive_limits: Dict[str, float] = {}
+# Monotonic time until which calls wait, from a Retry-After header
+_blocked_until: Dict[str, float] = {}
+
+
+def max_concurrency() -> int:
+    """Return the per-platform concurrency limit from ``GIT_MCP_MAX_CONCURRENCY``."""
+    try:
+        return max(1, int(os.getenv("GIT_MCP_MAX_CONCURRENCY", "")))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENCY
+
+
+def rate_limit() -> int:
+    """Return the per-platform tool-calls-per-minute limit from ``GIT_MCP_RATE_LIMIT``.
+
+    ``0``, the default, disables rate limiting.
+    """
+    try:
+        return max(0, int(os.getenv("GIT_MCP_RATE_LIMIT", "")))
+    except ValueError:
+        return DEFAULT_RATE_LIMIT
+
+
+def _configured_rate(platform: str) -> int:
+    rate = _rate_overrides.get(platform)
+    return rate if rate is not None else rate_limit()
+
+
+def platform_bucket(platform: str) -> TokenBucket:
+    """Return the token bucket rate limiting calls to ``platform``.
+
+    Buckets follow the same per-loop lifecycle as admission controllers.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _buckets.get(platform)
+    if entry is None or entry[0] is not loop:
+        bucket = TokenBucket(_configured_rate(platform))
+        entry = _buckets[platform] = (loop, bucket)
+    return entry[1]
+
+
+def set_platform_rate(platform: str, rate: Optional[int]) -> int:
+    """Set the calls-per-minute limit for ``platform`` and return the rate in effect.
+
+    Passing ``None`` drops the override and falls back to
+    ``GIT_MCP_RATE_LIMIT``; ``0`` disables rate limiting for the platform.
+    """
+    if rate is None:
+        _rate_overrides.pop(platform, None)
+    else:
+        _rate_overrides[platform] = max(0, rate)
+    return _configured_rate(platform)
+
+
+async def _wait_for_rate(platform: str) -> None:
+    blocked = _blocked_until.get(platform, 0.0) - time.monotonic()
+    if blocked > 0:
+        await asyncio.sleep(blocked)
+    rate = _configured_rate(platform)
+    if not rate:
+        return
+    bucket = platform_bucket(platform)
+    if bucket.rate != rate:
+        bucket.set_rate(rate)
+    await bucket.acquire()
+
+
+def _configured_limit(platform: str) -> int:
+    """Return the runtime override, the platform's config, or the env default."""
+    if platform in _limit_overrides:
+        return _limit_overrides[platform]
+    platform_config = get_config().get_platform(platform)
+    if platform_config and platform_config.max_concurrency:
+        return max(1, platform_config.max_concurrency)
+    return max_concurrency()
+
+
+def _effective_limit(platform: str) -> int:
+    """Return the configured limit, lowered while the platform is throttling."""
+    limit = _configured_limit(platform)
+    adaptive = _adaptive_limits.get(platform)
+    return limit if adaptive is None else max(1, min(limit, int(adaptive)))
+
+
+def _throttle_delay(exc: Optional[BaseException]) -> Optional[float]:
+    """Return how long to back off if ``exc`` reports throttling, else ``None``.
+
+    The adapters wrap client library errors, so the exception chain is
+    searched for an HTTP status (``status``, ``response_code`` or
+    ``status_code``) and a ``Retry-After`` header. A throttling error
+    without that header backs off for ``0`` seconds.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        status = None
+        for name in ("status", "response_code", "status_code"):
+            value = getattr(exc, name, None)
+            if isinstance(value, int):
+                status = value
+                break
+        headers = getattr(exc, "headers", None)
+        retry_after = None
+        if isinstance(headers, Mapping):
+            retry_after = next(
+                (v for k, v in headers.items() if k.lower() == "retry-after"), None
+            )
+        if status in THROTTLE_STATUSES or retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except (TypeError, ValueError):
+                return 0.0
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def _record_success(platform: str) -> None:
+    adaptive = _adaptive_limits.get(platform)
+    if adaptive is None:
+        return
+    adaptive += ADDITIVE_INCREASE
+    if adaptive >= _configured_limit(platform):
+        # Fully recovered, follow the configured limit again
+        del _adaptive_limits[platform]
+    else:
+        _adaptive_limits[platform] = adaptive
+
+
+def _record_throttle(platform: str, delay: float) -> None:
+    limit = _configured_limit(platform)
+    adaptive = min(_adaptive_limits.get(platform, limit), limit)
+    _adaptive_limits[platform] = max(1.0, adaptive * MULTIPLICATIVE_DECREASE)
+    if delay:
+        _blocked_until[platform] = max(
+            _blocked_until.get(platform, 0.0), time.monotonic() + delay
+        )
+
+
+def platform_controller(platform: str) -> AdmissionController:
+    """Return the admission controller limiting concurrent calls to ``platform``.
+
+    Controllers are created lazily inside the running event loop, and
+    recreated if a different loop is running (e.g. between test cases).
+    """
+    loop = asyncio.get_running_loop()
+    entry = _controllers.get(platform)
+    if entry is None or entry[0] is not loop:
+        controller = AdmissionController(_effective_limit(platform))
+        entry = _controllers[platform] = (loop, controller)
+    return entry[1]
+
+
+async def set_platform_limit(platform: str, limit: Optional[int]) -> int:
+    """Set the concurrency limit for ``platform`` and return the limit in effect.
+
+    Passing ``None`` drops the override and falls back to
+    ``GIT_MCP_MAX_CONCURRENCY``. Setting a limit also resets any adaptive
+    back-off from earlier throttling.
+    """
+    if limit is None:
+        _limit_overrides.pop(platform, None)
+    else:
+        _limit_overrides[platform] = max(1, limit)
+    _adaptive_limits.pop(platform, None)
+    effective = _configured_limit(platform)
+    await platform_controller(platform).set_limit(effective)
+    return effective
+
+
+@asynccontextmanager
+async def platform_slot(platform: str) -> AsyncIterator[None]:
+    """Hold one of ``platform``'s concurrency slots for the duration of a call.
+
+    The call first waits for the platform's rate limit, then for a free slot.
+    The number of slots adapts to the platform's responses (AIMD): it is
+    halved when a call is throttled, honouring any ``Retry-After``, and grows
+    back towards the configured limit as calls succeed.
+    """
+    await _wait_for_rate(platform)
+    controller = platform_controller(platform)
+    await _sync_limit(controller, platform)
+    async with controller.slot():
+        try:
+            yield
+        except Exception as e:
+            delay = _throttle_delay(e)
+            if delay is not None:
+                _record_throttle(platform, delay)
+                await _sync_limit(controller, platform)
+            raise
+        else:
+            _record_success(platform)
+            await _sync_limit(controller, platform)
+
+
+async def _sync_limit(controller: AdmissionController, platform: str) -> None:
+    limit = _effective_limit(platform)
+    if controller.limit != limit:
+        # Also picks up changes to GIT_MCP_MAX_CONCURRENCY without a restart
+        await controller.set_limit(limit)
+
+
+def platform_limits(platform: str) -> Dict[str, Any]:
+    """Return the current concurrency and rate limit state for ``platform``."""
+    controller = platform_controller(platform)
+    rate = _configured_rate(platform)
+    return {
+        "platform": platform,
+        "concurrency": {
+            "limit": _configured_limit(platform),
+            "active": controller.active,
+        },
+        "rate": {
+            "rpm": rate,
+            "available": int(platform_bucket(platform).tokens) if rate else None,
+        },
+        "backoff": {
+            "limit": _effective_limit(platform),
+            "retry_in": round(
+                max(0.0, _blocked_until.get(platform, 0.0) - time.monotonic()), 1
+            ),
+        },
+    }
@@ -1,12 +1,16 @@
 """Configuration management for git-mcp."""
 
+import logging
+import threading
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 import keyring
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class PlatformConfig:
@@ -18,12 +22,16 @@ class PlatformConfig:
     token: Optional[str] = None
     username: Optional[str] = None
     ssl_verify: bool = True  # SSL verification (default: True for security)
+    max_concurrency: Optional[int] = None  # Overrides GIT_MCP_MAX_CONCURRENCY
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding sensitive data."""
         data = asdict(self)
         # Remove token from config file, it's stored in keyring
         data.pop("token", None)
+        # Only write optional tuning knobs that are actually set
+        if data["max_concurrency"] is None:
+            del data["max_concurrency"]
         return data
 
 
@@ -54,6 +62,13 @@ class GitMCPConfig:
         self.platforms: Dict[str, PlatformConfig] = {}
         self.defaults = DefaultSettings()
         self.aliases: List[Alias] = []
+        self._loaded_mtime_ns: Optional[int] = None
+        # Bumped whenever the in-memory configuration is replaced or saved
+        self.generation = 0
+        # mtime of a file version that failed to parse, so it is not retried
+        self._failed_mtime_ns: Optional[int] = None
+        # Serializes reloads; get_config() is also called from worker threads
+        self._reload_lock = threading.Lock()
 
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
@@ -61,16 +76,82 @@ class GitMCPConfig:
         # Load existing configuration
         self.load()
 
+    def _config_mtime_ns(self) -> Optional[int]:
+        """Return the config file modification time, or None if it is missing."""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def reload_if_changed(self) -> bool:
+        """Reload configuration if the file changed since it was last read.
+
+        Costs a single ``stat`` when nothing changed, so it is cheap enough to
+        call on every request. A file that fails to parse (e.g. one that is
+        half-written) is logged and the last good configuration is kept.
+
+        Returns:
+            bool: True if the configuration was reloaded, False otherwise
+        """
+        mtime_ns = self._config_mtime_ns()
+        if mtime_ns in (self._loaded_mtime_ns, self._failed_mtime_ns):
+            return False
+
+        with self._reload_lock:
+            mtime_ns = self._config_mtime_ns()
+            if mtime_ns in (self._loaded_mtime_ns, self._failed_mtime_ns):
+                return False
+            try:
+                self.load()
+            except ValueError as e:
+                self._failed_mtime_ns = mtime_ns
+                logger.warning("Keeping the previous configuration: %s", e)
+                return False
+        return True
+
+    def reload(self) -> None:
+        """Read the configuration file again.
+
+        Raises:
+            ValueError: If the file cannot be parsed; the current
+                configuration is left unchanged
+        """
+        with self._reload_lock:
+            self.load()
+
     def load(self) -> None:
-        """Load configuration from file."""
-        if not self.config_file.exists():
-            return
+        """Load configuration from file.
+
+        The file is parsed completely before anything is replaced, so a
+        parse error leaves the current configuration untouched.
+
+        Raises:
+            ValueError: If the file cannot be parsed
+        """
+        # Taken before reading, so a write that races the read is seen later
+        mtime_ns = self._config_mtime_ns()
+        if mtime_ns is None:
+            platforms, defaults, aliases = {}, DefaultSettings(), []
+        else:
+            platforms, defaults, aliases = self._parse()
 
+        self.platforms = platforms
+        self.defaults = defaults
+        self.aliases = aliases
+        self._loaded_mtime_ns = mtime_ns
+        self._failed_mtime_ns = None
+        self.generation += 1
+
+    def _parse(
+        self,
+    ) -> Tuple[Dict[str, PlatformConfig], DefaultSettings, List[Alias]]:
+        """Parse the config file into platforms, defaults and aliases."""
         try:
             with open(self.config_file, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f) or {}
 
             # Load platforms
+            platforms = {}
             platforms_data = data.get("platforms", {})
             for name, platform_data in platforms_data.items():
                 # Make a copy to avoid modifying the original data
@@ -80,19 +161,19 @@ class GitMCPConfig:
                 platform_config = PlatformConfig(name=name, **platform_data_copy)
                 # Load token from keyring
                 platform_config.token = self.get_token(name)
-                self.platforms[name] = platform_config
+                platforms[name] = platform_config
 
             # Load defaults
-            defaults_data = data.get("defaults", {})
-            self.defaults = DefaultSettings(**defaults_data)
+            defaults = DefaultSettings(**data.get("defaults", {}))
 
             # Load aliases
-            aliases_data = data.get("aliases", [])
-            self.aliases = [Alias(**alias) for alias in aliases_data]
+            aliases = [Alias(**alias) for alias in data.get("aliases", [])]
 
         except Exception as e:
             raise ValueError(f"Failed to load configuration: {e}")
 
+        return platforms, defaults, aliases
+
     def save(self) -> None:
         """Save configuration to file."""
         data = {
@@ -109,6 +190,10 @@ class GitMCPConfig:
         except Exception as e:
             raise ValueError(f"Failed to save configuration: {e}")
 
+        # Our own writes are already reflected in memory
+        self._loaded_mtime_ns = self._config_mtime_ns()
+        self.generation += 1
+
     async def add_platform(
         self,
         name: str,
@@ -330,10 +415,16 @@ _config_instance: Optional[GitMCPConfig] = None
 
 
 def get_config() -> GitMCPConfig:
-    """Get the global configuration instance."""
+    """Get the global configuration instance.
+
+    The instance is created once and only re-parsed when the config file's
+    mtime changes, e.g. after ``git-mcp config add`` in another process.
+    """
     global _config_instance
     if _config_instance is None:
         _config_instance = GitMCPConfig()
+    else:
+        _config_instance.reload_if_changed()
     return _config_instance
 
 
@@ -0,0 +1 @@
+"""Data files shipped with Git MCP Server."""
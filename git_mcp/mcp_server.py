@@ -1,10 +1,48 @@
 """Git MCP Server - MCP interface for Git repository management."""
 
-from typing import List, Dict, Any, Optional
+from typing import (
+    Any,
+    AsyncContextManager,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+import asyncio
+import atexit
+import functools
+import importlib.resources
+import inspect
 import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from importlib.resources.abc import Traversable
+from pathlib import Path
+
+import anyio
 from mcp.server.fastmcp import FastMCP
 
-from .services.platform_service import PlatformService
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
+from .core.concurrency import (
+    platform_limits,
+    platform_slot,
+    set_platform_limit,
+    set_platform_rate,
+)
+from .core.config import get_config
+from .core.exceptions import ConfigurationError
+from .services.platform_service import PlatformService, set_worker_call_wrapper
 from .core.logging import setup_logging, get_logger
 
 
@@ -15,96 +53,275 @@ mcp = FastMCP("Git MCP Server")
 logger = get_logger("git_mcp.mcp_server")
 
 
-# Platform Management Tools
-@mcp.tool()
-async def list_platforms() -> List[Dict[str, str]]:
-    """List all configured Git platforms (GitLab, GitHub, etc.)"""
-    logger.debug("MCP Tool: list_platforms called")
-    result = await PlatformService.list_platforms()
-    logger.debug(f"MCP Tool: list_platforms returned {len(result)} platforms")
-    return result
-
-
-@mcp.tool()
-async def test_platform_connection(platform: str) -> Dict[str, Any]:
-    """Test connection to a configured platform"""
-    logger.debug(f"MCP Tool: test_platform_connection called for platform '{platform}'")
-    result = await PlatformService.test_platform_connection(platform)
-    logger.debug(
-        f"MCP Tool: test_platform_connection result: {result.get('success', False)}"
+# Passthrough tools: (tool name, description). Each entry is registered as a
+# thin wrapper around the PlatformService method of the same name, exposing
+# the service signature with ``platform_name`` renamed to ``platform``.
+PASSTHROUGH_TOOLS: List[Tuple[str, str]] = [
+    # Platform Management Tools
+    ("list_platforms", "List all configured Git platforms (GitLab, GitHub, etc.)"),
+    ("test_platform_connection", "Test connection to a configured platform"),
+    (
+        "refresh_platform_username",
+        "Refresh username for a configured platform by fetching from token",
+    ),
+    ("get_platform_config", "Get configuration information for a specific platform"),
+    (
+        "get_current_user_info",
+        "Get current user information directly from platform API",
+    ),
+    # Project Management Tools
+    ("list_projects", "List projects from a specified Git platform"),
+    ("get_project_details", "Get detailed information about a specific project"),
+    ("create_project", "Create a new project on the specified platform"),
+    ("delete_project", "Delete a project from the specified platform"),
+    # Issue Management Tools
+    (
+        "list_issues",
+        "List issues in a project. State can be 'opened', 'closed', or 'all'",
+    ),
+    (
+        "list_all_issues",
+        "List issues across all projects (global search). No project_id needed.",
+    ),
+    (
+        "get_issue_details",
+        "Get detailed information about a specific issue including comments",
+    ),
+    ("create_issue", "Create a new issue in a project"),
+    ("close_issue", "Close an issue"),
+    ("create_issue_comment", "Create a comment on an issue"),
+    # Merge Request Management Tools
+    (
+        "list_merge_requests",
+        "List merge requests in a project. State can be 'opened', 'closed', 'merged', or 'all'",
+    ),
+    (
+        "get_merge_request_details",
+        "Get detailed information about a specific merge request",
+    ),
+    (
+        "list_my_merge_requests",
+        "List merge requests created by the current user (automatically uses configured username)",
+    ),
+    (
+        "get_merge_request_diff",
+        """Get diff/changes for a merge request
+
+        Args:
+            platform: The platform name (e.g., 'gitlab', 'github')
+            project_id: The project identifier
+            mr_id: The merge request/pull request ID
+            **options: Optional parameters:
+                - format: Response format ('json', 'unified') - default: 'json'
+                - include_diff: Include actual diff content (bool) - default: True
+                - max_files: Maximum number of files to list - default: 100
+                - max_bytes: Maximum total size of diff content - default: 1000000
+
+        Returns:
+            Dict containing:
+                - mr_id: The merge request ID
+                - total_changes: Summary of additions, deletions, files changed
+                - files: List of changed files with details
+                - diff_format: Format of the response
+                - truncated: Whether files or diff content were left out
+        """,
+    ),
+    (
+        "get_merge_request_commits",
+        """Get commits for a merge request
+
+        Args:
+            platform: The platform name (e.g., 'gitlab', 'github')
+            project_id: The project identifier
+            mr_id: The merge request/pull request ID
+            **filters: Optional filters for commit selection
+
+        Returns:
+            Dict containing:
+                - mr_id: The merge request ID
+                - total_commits: Number of commits
+                - commits: List of commit details with sha, message, author, dates, etc.
+        """,
+    ),
+    (
+        "close_merge_request",
+        """Close a merge request without merging
+
+        Args:
+            platform: The platform name (e.g., 'gitlab', 'github')
+            project_id: The project identifier
+            mr_id: The merge request/pull request ID
+            **kwargs: Additional platform-specific parameters
+
+        Returns:
+            Dict containing:
+                - merge_request: Updated merge request details
+                - message: Success message
+                - platform: The platform name
+                - project_id: The project identifier
+                - mr_id: The merge request ID
+        """,
+    ),
+    (
+        "update_merge_request",
+        """Update a merge request (title, description, etc.)
+
+        Args:
+            platform: The platform name (e.g., 'gitlab', 'github')
+            project_id: The project identifier
+            mr_id: The merge request/pull request ID
+            **kwargs: Update parameters (title, description, state, etc.)
+
+        Returns:
+            Dict containing:
+                - merge_request: Updated merge request details
+                - message: Success message
+                - platform: The platform name
+                - project_id: The project identifier
+                - mr_id: The merge request ID
+        """,
+    ),
+    # Fork operations
+    (
+        "create_fork",
+        """Create a fork of a repository
+
+        Args:
+            platform: The platform name (github, gitlab)
+            project_id: The repository ID to fork (owner/repo for GitHub, numeric for GitLab)
+            **kwargs: Platform-specific fork parameters
+                     - GitHub: organization, name, default_branch_only
+                     - GitLab: namespace, name, path
+        """,
+    ),
+    (
+        "get_fork_info",
+        """Get fork information for a repository
+
+        Args:
+            platform: The platform name (github, gitlab)
+            project_id: The repository ID to check
+
+        Returns:
+            Dictionary with fork status, parent repository, and other fork details
+        """,
+    ),
+    (
+        "list_forks",
+        """List forks of a repository
+
+        Args:
+            platform: The platform name (github, gitlab)
+            project_id: The repository ID to list forks for
+            limit: Maximum number of forks to return
+
+        Returns:
+            List of fork repositories
+        """,
+    ),
+]
+
+
+def _platform_slot(platform: Optional[str]) -> AsyncContextManager[Any]:
+    """Limit concurrent calls per platform (see ``GIT_MCP_MAX_CONCURRENCY``)."""
+    return platform_slot(platform) if platform else nullcontext()
+
+
+def _passthrough_tool(name: str, description: str) -> Callable[..., Any]:
+    """Build an MCP tool that forwards its arguments to ``PlatformService.<name>``.
+
+    Synchronous service methods only read local configuration, so their tools
+    are plain functions that FastMCP calls directly, without a coroutine or a
+    concurrency slot.
+    """
+    service_method = getattr(PlatformService, name)
+    signature = inspect.signature(service_method)
+    signature = signature.replace(
+        parameters=[
+            param.replace(name="platform") if param.name == "platform_name" else param
+            for param in signature.parameters.values()
+        ]
     )
-    return result
 
+    def bind(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> inspect.BoundArguments:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        logger.debug("MCP Tool: %s called", name)
+        return bound
 
-@mcp.tool()
-async def refresh_platform_username(platform: str) -> Dict[str, Any]:
-    """Refresh username for a configured platform by fetching from token"""
-    return await PlatformService.refresh_platform_username(platform)
+    if inspect.iscoroutinefunction(service_method):
 
+        async def tool(*args: Any, **kwargs: Any) -> Any:
+            bound = bind(args, kwargs)
+            async with _platform_slot(bound.arguments.get("platform")):
+                # Resolve the service method per call so it can be patched in tests
+                return await getattr(PlatformService, name)(*bound.args, **bound.kwargs)
 
-@mcp.tool()
-async def get_platform_config(platform: str) -> Dict[str, Any]:
-    """Get configuration information for a specific platform"""
-    return await PlatformService.get_platform_config(platform)
+    else:
 
+        def tool(*args: Any, **kwargs: Any) -> Any:
+            bound = bind(args, kwargs)
+            return getattr(PlatformService, name)(*bound.args, **bound.kwargs)
 
-@mcp.tool()
-async def get_current_user_info(platform: str) -> Dict[str, Any]:
-    """Get current user information directly from platform API"""
-    return await PlatformService.get_current_user_info(platform)
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = inspect.cleandoc(description)
+    tool.__signature__ = signature  # type: ignore[attr-defined]
+    return tool
 
 
-# Project Management Tools
-@mcp.tool()
-async def list_projects(
-    platform: str, limit: Optional[int] = 20, **filters
-) -> List[Dict[str, Any]]:
-    """List projects from a specified Git platform"""
-    return await PlatformService.list_projects(platform, limit, **filters)
+def _register_passthrough_tools() -> None:
+    """Register the ``PASSTHROUGH_TOOLS`` and expose them as module attributes."""
+    for name, description in PASSTHROUGH_TOOLS:
+        globals()[name] = mcp.tool(
+            name=name, description=inspect.cleandoc(description)
+        )(_passthrough_tool(name, description))
 
 
-@mcp.tool()
-async def get_project_details(platform: str, project_id: str) -> Dict[str, Any]:
-    """Get detailed information about a specific project"""
-    return await PlatformService.get_project_details(platform, project_id)
+_register_passthrough_tools()
 
 
-@mcp.tool()
-async def create_project(platform: str, name: str, **kwargs) -> Dict[str, Any]:
-    """Create a new project on the specified platform"""
-    return await PlatformService.create_project(platform, name, **kwargs)
+# Fields that are skipped rather than sent when empty
+_NON_EMPTY_ISSUE_FIELDS = frozenset(
+    {"labels", "assignee", "state", "target_project_id"}
+)
 
 
-@mcp.tool()
-async def delete_project(platform: str, project_id: str) -> Dict[str, Any]:
-    """Delete a project from the specified platform"""
-    return await PlatformService.delete_project(platform, project_id)
+def _normalize_issue_kwargs(kwargs: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """Map tool-level fields onto the keyword names the adapters expect.
 
+    ``labels`` is passed on as a list for the adapter to encode, ``assignee``
+    becomes ``assignee_username`` and ``state`` becomes ``state_event``. Fields left
+    as ``None`` and empty label lists are skipped. Empty strings are passed on
+    for free-text fields so e.g. the description can be cleared, but skipped
+    for identifiers and states, which the platforms reject when empty.
+    ``kwargs`` is updated in place, so pass the tool's own ``**kwargs`` dict,
+    which is never shared with the caller.
+    """
+    renames = {"assignee": "assignee_username", "state": "state_event"}
+    for key, value in fields.items():
+        if key in _NON_EMPTY_ISSUE_FIELDS and not value:
+            continue
+        if value is not None:
+            kwargs[renames.get(key, key)] = value
+    return kwargs
 
-# Issue Management Tools
-@mcp.tool()
-async def list_issues(
-    platform: str,
-    project_id: str,
-    state: str = "opened",
-    limit: Optional[int] = 20,
-    **filters,
-) -> List[Dict[str, Any]]:
-    """List issues in a project. State can be 'opened', 'closed', or 'all'"""
-    return await PlatformService.list_issues(
-        platform, project_id, state, limit, **filters
-    )
 
+def _configured_username(platform: str) -> str:
+    """Return the username configured for ``platform``.
 
-@mcp.tool()
-async def list_all_issues(
-    platform: str,
-    state: str = "opened",
-    limit: Optional[int] = 20,
-    **filters,
-) -> List[Dict[str, Any]]:
-    """List issues across all projects (global search). No project_id needed."""
-    return await PlatformService.list_all_issues(platform, state, limit, **filters)
+    Reads the in-memory configuration directly rather than awaiting the
+    ``get_platform_config`` service call.
+
+    Raises:
+        ConfigurationError: If the platform has no username configured
+    """
+    platform_config = get_config().get_platform(platform)
+    if not platform_config or not platform_config.username:
+        raise ConfigurationError(
+            f"No username configured for platform '{platform}'. "
+            f"Use 'refresh_platform_username' tool to fetch it automatically."
+        )
+    return platform_config.username
 
 
 @mcp.tool()
@@ -117,27 +334,13 @@ async def list_my_issues(
     """List issues assigned to me across all projects."""
     # Add assignee filter automatically using configured username
     try:
-        config = await PlatformService.get_platform_config(platform)
-        if not config.get("found") or not config.get("username"):
-            return [
-                {
-                    "error": f"No username configured for platform '{platform}'. "
-                    f"Use 'refresh_platform_username' tool to fetch it automatically."
-                }
-            ]
-
-        filters["assignee"] = config["username"]
-        return await PlatformService.list_all_issues(platform, state, limit, **filters)
-    except Exception as e:
-        return [{"error": f"Failed to list my issues: {str(e)}"}]
-
+        filters["assignee"] = _configured_username(platform)
+    except ConfigurationError as e:
+        return [{"error": str(e)}]
 
-@mcp.tool()
-async def get_issue_details(
-    platform: str, project_id: str, issue_id: str
-) -> Dict[str, Any]:
-    """Get detailed information about a specific issue including comments"""
-    return await PlatformService.get_issue_details(platform, project_id, issue_id)
+    # Platform errors propagate so the client sees their real type
+    async with _platform_slot(platform):
+        return await PlatformService.list_all_issues(platform, state, limit, **filters)
 
 
 @mcp.tool()
@@ -148,23 +351,10 @@ async def get_issue_by_url(url: str) -> Dict[str, Any]:
     - https://gitlab.com/group/project/-/issues/123
     - https://github.com/user/repo/issues/456
     """
-    return await PlatformService.get_issue_by_url(url)
-
-
-@mcp.tool()
-async def create_issue(
-    platform: str,
-    project_id: str,
-    title: str,
-    description: Optional[str] = None,
-    labels: Optional[List[str]] = None,
-    assignee: Optional[str] = None,
-    **kwargs,
-) -> Dict[str, Any]:
-    """Create a new issue in a project"""
-    return await PlatformService.create_issue(
-        platform, project_id, title, description, labels, assignee, **kwargs
-    )
+    # Parse once up front: the platform is needed to pick a concurrency slot
+    platform, project_id, issue_id = PlatformService.parse_issue_url(url)
+    async with _platform_slot(platform):
+        return await PlatformService.get_issue_details(platform, project_id, issue_id)
 
 
 @mcp.tool()
@@ -180,60 +370,33 @@ async def update_issue(
     **kwargs,
 ) -> Dict[str, Any]:
     """Update an existing issue"""
-    update_kwargs = kwargs.copy()
-    if title:
-        update_kwargs["title"] = title
-    if description:
-        update_kwargs["description"] = description
-    if labels:
-        update_kwargs["labels"] = ",".join(labels)
-    if assignee:
-        update_kwargs["assignee_username"] = assignee
-    if state:
-        update_kwargs["state_event"] = state
-
-    return await PlatformService.update_issue(
-        platform, project_id, issue_id, **update_kwargs
-    )
-
-
-@mcp.tool()
-async def close_issue(platform: str, project_id: str, issue_id: str) -> Dict[str, Any]:
-    """Close an issue"""
-    return await PlatformService.close_issue(platform, project_id, issue_id)
-
-
-@mcp.tool()
-async def create_issue_comment(
-    platform: str, project_id: str, issue_id: str, body: str, **kwargs
-) -> Dict[str, Any]:
-    """Create a comment on an issue"""
-    return await PlatformService.create_issue_comment(
-        platform, project_id, issue_id, body, **kwargs
+    update_kwargs = _normalize_issue_kwargs(
+        kwargs,
+        title=title,
+        description=description,
+        labels=labels,
+        assignee=assignee,
+        state=state,
     )
 
-
-# Merge Request Management Tools
-@mcp.tool()
-async def list_merge_requests(
-    platform: str,
-    project_id: str,
-    state: str = "opened",
-    limit: Optional[int] = 20,
-    **filters,
-) -> List[Dict[str, Any]]:
-    """List merge requests in a project. State can be 'opened', 'closed', 'merged', or 'all'"""
-    return await PlatformService.list_merge_requests(
-        platform, project_id, state, limit, **filters
-    )
+    async with _platform_slot(platform):
+        return await PlatformService.update_issue(
+            platform, project_id, issue_id, **update_kwargs
+        )
 
 
-@mcp.tool()
-async def get_merge_request_details(
-    platform: str, project_id: str, mr_id: str
-) -> Dict[str, Any]:
-    """Get detailed information about a specific merge request"""
-    return await PlatformService.get_merge_request_details(platform, project_id, mr_id)
+# Arguments passed to the service positionally, so a nested ``kwargs`` payload
+# must not repeat them as keyword arguments
+_MR_NAMED_ARGS = frozenset(
+    {
+        "platform",
+        "platform_name",
+        "project_id",
+        "title",
+        "source_branch",
+        "target_branch",
+    }
+)
 
 
 @mcp.tool()
@@ -275,7 +438,7 @@ async def create_merge_request(
         # GitHub cross-repo PR (using branch format)
         create_merge_request("github", "upstream/repo", "Fix bug", "fork-owner:feature-branch", "main")
     """
-    create_kwargs = kwargs.copy()
+    create_kwargs = kwargs
 
     # Some MCP clients pass a single 'kwargs' argument as a JSON string.
     # Parse and merge it so downstream adapters receive real keyword args.
@@ -283,16 +446,15 @@ async def create_merge_request(
         nested_kwargs = create_kwargs.pop("kwargs")
         try:
             if isinstance(nested_kwargs, str):
-                parsed = json.loads(nested_kwargs)
+                parsed = _loads_json(nested_kwargs)
             else:
                 parsed = nested_kwargs
             if isinstance(parsed, dict):
-                for k, v in parsed.items():
-                    # Do not overwrite explicitly provided keys
-                    if k not in create_kwargs:
-                        create_kwargs[k] = v
+                # Do not overwrite explicitly provided keys or named arguments
+                for k in parsed.keys() - create_kwargs.keys() - _MR_NAMED_ARGS:
+                    create_kwargs[k] = parsed[k]
         except Exception as e:  # nosec B110 - best-effort parsing
-            logger.warning(f"Failed to parse kwargs JSON: {e}")
+            logger.warning("Failed to parse kwargs JSON: %s", e)
 
     # Handle description from either parameter or kwargs
     final_description = description
@@ -307,206 +469,181 @@ async def create_merge_request(
     if final_description:
         create_kwargs["description"] = final_description
         logger.debug(
-            f"MCP Server - description parameter set: {final_description[:100]}..."
-            if len(final_description) > 100
-            else f"MCP Server - description parameter set: {final_description}"
+            "MCP Server - description parameter set: %.100s", final_description
         )
 
-    if assignee:
-        create_kwargs["assignee_username"] = assignee
-
-    if target_project_id:
-        create_kwargs["target_project_id"] = target_project_id
-
-    logger.debug(f"MCP Server - kwargs being passed: {list(create_kwargs.keys())}")
-    return await PlatformService.create_merge_request(
-        platform, project_id, title, source_branch, target_branch, **create_kwargs
+    create_kwargs = _normalize_issue_kwargs(
+        create_kwargs, assignee=assignee, target_project_id=target_project_id
     )
 
-
-@mcp.tool()
-async def list_my_merge_requests(
-    platform: str,
-    project_id: str,
-    state: str = "opened",
-    limit: Optional[int] = 20,
-    **filters,
-) -> List[Dict[str, Any]]:
-    """List merge requests created by the current user (automatically uses configured username)"""
-    return await PlatformService.list_my_merge_requests(
-        platform, project_id, state, limit, **filters
-    )
+    logger.debug("MCP Server - kwargs being passed: %s", create_kwargs.keys())
+    async with _platform_slot(platform):
+        return await PlatformService.create_merge_request(
+            platform, project_id, title, source_branch, target_branch, **create_kwargs
+        )
 
 
-@mcp.tool()
-async def get_merge_request_diff(
-    platform: str, project_id: str, mr_id: str, **options
-) -> Dict[str, Any]:
-    """Get diff/changes for a merge request
+async def _gather_in_slots(platform: str, calls: List[Callable[[], Any]]) -> List[Any]:
+    """Run ``calls`` concurrently, each in a platform slot, keeping failures in place."""
 
-    Args:
-        platform: The platform name (e.g., 'gitlab', 'github')
-        project_id: The project identifier
-        mr_id: The merge request/pull request ID
-        **options: Optional parameters:
-            - format: Response format ('json', 'unified') - default: 'json'
-            - include_diff: Include actual diff content (bool) - default: True
+    async def run(call: Callable[[], Any]) -> Any:
+        async with _platform_slot(platform):
+            return await call()
 
-    Returns:
-        Dict containing:
-            - mr_id: The merge request ID
-            - total_changes: Summary of additions, deletions, files changed
-            - files: List of changed files with details
-            - diff_format: Format of the response
-            - truncated: Whether response was truncated
-    """
-    return await PlatformService.get_merge_request_diff(
-        platform, project_id, mr_id, **options
+    results = await asyncio.gather(
+        *(run(call) for call in calls), return_exceptions=True
     )
+    return [
+        {"error": str(result)} if isinstance(result, Exception) else result
+        for result in results
+    ]
 
 
 @mcp.tool()
-async def get_merge_request_commits(
-    platform: str, project_id: str, mr_id: str, **filters
-) -> Dict[str, Any]:
-    """Get commits for a merge request
+async def get_issues_bulk(
+    platform: str, items: List[Dict[str, str]]
+) -> List[Dict[str, Any]]:
+    """Get details for several issues in one call.
 
-    Args:
-        platform: The platform name (e.g., 'gitlab', 'github')
-        project_id: The project identifier
-        mr_id: The merge request/pull request ID
-        **filters: Optional filters for commit selection
+    Issues are fetched concurrently, bounded by the platform's concurrency
+    limit, so large batches are safe. Results are returned in input order; an
+    issue that fails to load, or an item missing its IDs, yields an
+    ``{"error": ...}`` entry instead.
 
-    Returns:
-        Dict containing:
-            - mr_id: The merge request ID
-            - total_commits: Number of commits
-            - commits: List of commit details with sha, message, author, dates, etc.
+    Args:
+        platform: Platform name
+        items: Issues to fetch, each as {"project_id": ..., "issue_id": ...}
     """
-    return await PlatformService.get_merge_request_commits(
-        platform, project_id, mr_id, **filters
-    )
+    results: List[Any] = [None] * len(items)
+    calls, positions = [], []
+    for index, item in enumerate(items):
+        missing = [
+            key
+            for key in ("project_id", "issue_id")
+            if not isinstance(item, dict) or not item.get(key)
+        ]
+        if missing:
+            results[index] = {"error": f"Item {index} is missing {', '.join(missing)}"}
+            continue
+        calls.append(
+            functools.partial(
+                PlatformService.get_issue_details,
+                platform,
+                item["project_id"],
+                item["issue_id"],
+            )
+        )
+        positions.append(index)
+
+    for index, result in zip(positions, await _gather_in_slots(platform, calls)):
+        results[index] = result
+    return results
 
 
 @mcp.tool()
-async def close_merge_request(
-    platform: str, project_id: str, mr_id: str, **kwargs
+async def list_issues_bulk(
+    platform: str,
+    project_ids: List[str],
+    state: str = "opened",
+    limit: Optional[int] = 20,
 ) -> Dict[str, Any]:
-    """Close a merge request without merging
+    """List issues for several projects in one call.
 
-    Args:
-        platform: The platform name (e.g., 'gitlab', 'github')
-        project_id: The project identifier
-        mr_id: The merge request/pull request ID
-        **kwargs: Additional platform-specific parameters
+    Projects are queried concurrently, bounded by the platform's concurrency
+    limit. Returns a mapping of project ID to its issues, or to an
+    ``{"error": ...}`` entry if that project could not be listed.
 
-    Returns:
-        Dict containing:
-            - merge_request: Updated merge request details
-            - message: Success message
-            - platform: The platform name
-            - project_id: The project identifier
-            - mr_id: The merge request ID
+    Args:
+        platform: Platform name
+        project_ids: Projects to list issues for
+        state: Issue state filter (opened, closed, all)
+        limit: Maximum number of issues per project
     """
-    return await PlatformService.close_merge_request(
-        platform, project_id, mr_id, **kwargs
+    results = await _gather_in_slots(
+        platform,
+        [
+            functools.partial(
+                PlatformService.list_issues, platform, project_id, state, limit
+            )
+            for project_id in project_ids
+        ],
     )
+    return dict(zip(project_ids, results))
 
 
 @mcp.tool()
-async def update_merge_request(
-    platform: str, project_id: str, mr_id: str, **kwargs
+async def set_concurrency_limit(
+    platform: str, limit: Optional[int] = None
 ) -> Dict[str, Any]:
-    """Update a merge request (title, description, etc.)
+    """Change how many calls to a platform may run at once.
 
     Args:
-        platform: The platform name (e.g., 'gitlab', 'github')
-        project_id: The project identifier
-        mr_id: The merge request/pull request ID
-        **kwargs: Update parameters (title, description, state, etc.)
-
-    Returns:
-        Dict containing:
-            - merge_request: Updated merge request details
-            - message: Success message
-            - platform: The platform name
-            - project_id: The project identifier
-            - mr_id: The merge request ID
+        platform: Platform name
+        limit: New limit, or omit to fall back to GIT_MCP_MAX_CONCURRENCY
     """
-    return await PlatformService.update_merge_request(
-        platform, project_id, mr_id, **kwargs
-    )
+    if limit is not None and limit < 1:
+        return {"error": "Concurrency limit must be at least 1"}
+    effective = await set_platform_limit(platform, limit)
+    return {"platform": platform, "limit": effective}
 
 
-# Fork operations
 @mcp.tool()
-async def create_fork(platform: str, project_id: str, **kwargs) -> Dict[str, Any]:
-    """Create a fork of a repository
-
-    Args:
-        platform: The platform name (github, gitlab)
-        project_id: The repository ID to fork (owner/repo for GitHub, numeric for GitLab)
-        **kwargs: Platform-specific fork parameters
-                 - GitHub: organization, name, default_branch_only
-                 - GitLab: namespace, name, path
-    """
-    return await PlatformService.create_fork(platform, project_id, **kwargs)
+async def set_rate_limit(platform: str, rpm: Optional[int] = None) -> Dict[str, Any]:
+    """Change how many tool calls per minute may be made to a platform.
 
-
-@mcp.tool()
-async def get_fork_info(platform: str, project_id: str) -> Dict[str, Any]:
-    """Get fork information for a repository
+    Each tool call counts once, however many API requests it makes.
 
     Args:
-        platform: The platform name (github, gitlab)
-        project_id: The repository ID to check
-
-    Returns:
-        Dictionary with fork status, parent repository, and other fork details
+        platform: Platform name
+        rpm: Tool calls per minute, 0 to disable, or omit to fall back to GIT_MCP_RATE_LIMIT
     """
-    return await PlatformService.get_fork_info(platform, project_id)
+    if rpm is not None and rpm < 0:
+        return {"error": "Rate limit cannot be negative"}
+    return {"platform": platform, "rpm": set_platform_rate(platform, rpm)}
 
 
 @mcp.tool()
-async def list_forks(
-    platform: str, project_id: str, limit: Optional[int] = 20
-) -> List[Dict[str, Any]]:
-    """List forks of a repository
-
-    Args:
-        platform: The platform name (github, gitlab)
-        project_id: The repository ID to list forks for
-        limit: Maximum number of forks to return
+async def reload_config() -> Dict[str, Any]:
+    """Re-read the configuration file and drop cached platform responses.
 
-    Returns:
-        List of fork repositories
+    Configuration changes are normally picked up automatically when the file's
+    modification time changes; use this to force a reload.
     """
-    return await PlatformService.list_forks(platform, project_id, limit)
+    config = get_config()
+    config.reload()
+    PlatformService.clear_cache()
+    return {
+        "platforms": config.list_platforms(),
+        "message": "Configuration reloaded",
+    }
 
 
 @mcp.resource("config://platforms")
-async def get_platforms_config() -> Dict[str, Any]:
+def get_platforms_config() -> Dict[str, Any]:
     """Get the current platforms configuration"""
-    platforms = await PlatformService.list_platforms()
-
-    from .core.config import get_config
-
+    # Built straight from the in-memory config in one pass
     config = get_config()
-
     return {
         "platforms": {
-            p["name"]: {"type": p["type"], "url": p["url"], "username": p["username"]}
-            for p in platforms
-        },
-        "defaults": {
-            "platform": config.defaults.platform,
-            "output_format": config.defaults.output_format,
-            "page_size": config.defaults.page_size,
-            "timeout": config.defaults.timeout,
+            name: {
+                "type": platform_config.type,
+                "url": platform_config.url,
+                "username": platform_config.username or "",
+            }
+            for name, platform_config in config.platforms.items()
         },
+        "defaults": config.defaults.model_dump(
+            include={"platform", "output_format", "page_size", "timeout"}
+        ),
     }
 
 
+@mcp.resource("ratelimit://{platform}")
+async def get_rate_limit_resource(platform: str) -> Dict[str, Any]:
+    """Get the platform's concurrency limit, calls in flight and rate budget"""
+    return platform_limits(platform)
+
+
 @mcp.resource("project://{platform}/{project_id}")
 async def get_project_resource(platform: str, project_id: str) -> Dict[str, Any]:
     """Get project information as a resource"""
@@ -515,7 +652,6 @@ async def get_project_resource(platform: str, project_id: str) -> Dict[str, Any]
 
 def main():
     """Run the MCP server with stdio transport"""
-    import sys
     from . import get_version
 
     # Handle command line arguments
@@ -557,6 +693,18 @@ def main():
             )
             print("  GIT_MCP_SERVER_DEBUG        Enable debug mode (true/false)")
             print("  GIT_MCP_SERVER_LOG_FILE     Log to file path")
+            print(
+                "  GIT_MCP_MAX_CONCURRENCY     Max concurrent calls per platform (default: 10)"
+            )
+            print(
+                "  GIT_MCP_MAX_CONNECTIONS     Keep-alive connections per host (default: 20)"
+            )
+            print(
+                "  GIT_MCP_RATE_LIMIT          Max tool calls per minute per platform (default: 0 = off)"
+            )
+            print(
+                f"  GIT_MCP_PROFILE             Profile the server and write {PROFILE_OUTPUT}"
+            )
             print()
             print("Run without arguments to start the MCP server.")
             return
@@ -569,93 +717,181 @@ def main():
         # Still setup logging to respect environment variables
         setup_logging()
 
-    mcp.run()
+    atexit.register(PlatformService.close_adapters)
+    if os.getenv("GIT_MCP_PROFILE"):
+        _run_profiled(_run_stdio_server)
+    else:
+        _run_stdio_server()
+
+
+# Report written when the server runs with GIT_MCP_PROFILE set
+PROFILE_OUTPUT = "git-mcp.profile.html"
+
+
+def _run_profiled(run: Callable[[], None]) -> None:
+    """Run the server under pyinstrument and write an HTML report on exit.
+
+    pyinstrument samples only the thread it was started in, and adapter
+    calls run in worker threads, so each call is profiled in its worker and
+    the samples are merged with the event loop's into one report.
+    """
+    try:
+        from pyinstrument import Profiler
+        from pyinstrument.renderers import HTMLRenderer
+        from pyinstrument.session import Session
+    except ImportError:
+        logger.warning("GIT_MCP_PROFILE is set but pyinstrument is not installed")
+        run()
+        return
+
+    worker_sessions: List[Session] = []
 
+    def profile_worker(call: Callable[[], Any]) -> Any:
+        worker_profiler = Profiler(async_mode="disabled")
+        worker_profiler.start()
+        try:
+            return call()
+        finally:
+            # list.append is atomic, so workers need no lock
+            worker_sessions.append(worker_profiler.stop())
+
+    profiler = Profiler(async_mode="enabled")
+    set_worker_call_wrapper(profile_worker)
+    profiler.start()
+    try:
+        run()
+    finally:
+        set_worker_call_wrapper(None)
+        session = functools.reduce(
+            Session.combine, list(worker_sessions), profiler.stop()
+        )
+        output = Path(PROFILE_OUTPUT).resolve()
+        output.write_text(HTMLRenderer().render(session), encoding="utf-8")
+        logger.info("Profile written to %s", output)
 
-# Code Memory Content - Design Principles and Guidelines
-# This content is automatically added to user configuration files during installation
-CODE_MEMORY_CONTENT = """
 
-## Simplicity-First Design Principles
+def _run_stdio_server() -> None:
+    """Run the MCP server over stdio, on uvloop when it is installed."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+        return
 
-### Core Design Principles (Hierarchical Priority)
+    logger.debug("Running MCP server on uvloop")
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
 
-#### 1. KISS Principle (Primary Priority)
-- **Principle of Parsimony**: Select the most direct and comprehensible solution among available alternatives
-- **Cognitive Load Minimization**: Prioritize code readability and maintainability over algorithmic sophistication
-- **Single Problem Resolution**: Address one clearly defined problem per implementation unit
-- **Standard Library Preference**: Utilize established libraries and conventional patterns rather than custom implementations
-- **Explicit Solution Preference**: Default to obvious and transparent approaches when functionally equivalent
 
-#### 2. YAGNI Principle (Secondary Priority)
-- **Present Requirements Focus**: Implement only functionality required for current specifications
-- **Feature Scope Constraint**: Exclude speculative parameters, options, or configuration mechanisms
-- **Optimization Deferral**: Establish functional correctness before performance considerations
-- **Speculative Feature Rejection**: Eliminate functionality implemented for hypothetical future requirements
+@functools.lru_cache(maxsize=None)
+def _code_memory_content() -> str:
+    """Return the code memory guidelines added to agent configuration files.
 
-#### 3. DRY Principle (Tertiary Priority)
-- **Duplication Elimination**: Remove apparent code repetition while avoiding premature abstraction
-- **Pattern-Based Extraction**: Extract common logic only after clear usage patterns emerge
-- **Abstraction Threshold**: Prefer explicit duplication over speculative generalization
+    The text ships as package data and is only read when an installer needs
+    it, so the long-running server never loads it.
+    """
+    return (
+        importlib.resources.files("git_mcp.data")
+        .joinpath("code_memory.md")
+        .read_text(encoding="utf-8")
+    )
 
-#### 4. SOLID Principles (Quaternary Priority, Minimal Application)
-- **Single Responsibility**: Maintain one clearly defined purpose per functional unit
-- **Principle Application Restraint**: Apply remaining SOLID principles without architectural over-engineering
 
-### Anti-Patterns and Prohibited Practices
+def _package_command_files(package: str, suffix: str) -> List[Traversable]:
+    """List the slash command files ending in ``suffix`` shipped in ``package``.
 
-#### Over-Design Constraints
-- **Architectural Complexity Prohibition**: Avoid elaborate system architectures for straightforward problems
-- **Framework Development Restriction**: Implement scripts rather than generalized frameworks unless explicitly required
-- **Abstraction Layer Limitation**: Minimize unnecessary abstraction layers
-- **Generic Solution Avoidance**: Reject generic implementations for specific problem domains
+    The package directory is resolved once per install.
 
-#### Over-Analysis Restrictions
-- **Edge Case Analysis Limitation**: Avoid comprehensive upfront edge case enumeration
-- **Solution Adequacy Threshold**: Terminate design iteration at "sufficient" rather than "optimal" solutions
-- **Hypothetical Scenario Exclusion**: Exclude optimization for speculative use cases
-- **Decision Paralysis Prevention**: Establish clear decision points to prevent analysis stagnation
+    Raises:
+        FileNotFoundError: If the commands directory is missing from the package
+    """
+    commands_ref = importlib.resources.files(package)
+    if not commands_ref.is_dir():
+        raise FileNotFoundError(f"Commands directory '{package}' not found in package")
+    return [f for f in commands_ref.iterdir() if f.name.endswith(suffix)]
 
-#### Defensive Programming Constraints
-- **Input Validation Restriction**: Implement validation only for explicitly identified risk scenarios
-- **Error Handling Minimization**: Apply error handling mechanisms only where failure modes are documented
-- **Exception Wrapping Limitation**: Avoid comprehensive try-catch implementations without specific requirements
-- **Caller Trust Principle**: Assume correct caller behavior until empirical evidence suggests otherwise
-- **Failure Mode Simplification**: Implement rapid failure mechanisms rather than comprehensive error recovery
 
-### Implementation Methodology
+# Threads used to copy command files during install
+INSTALL_WORKERS = 8
 
-#### Required Practices
-- Implement straightforward and immediately comprehensible code structures
-- Utilize simple control flow mechanisms (conditional statements, iteration constructs)
-- Prefer language built-in functions over custom implementations
-- Design minimal, purpose-focused functions
-- Employ semantically clear variable nomenclature
-- Begin with the simplest functional solution
-- Introduce complexity only when explicitly specified in requirements
 
-#### Prohibited Practices
-- Elaborate class hierarchy construction
-- Universal configuration mechanism implementation
-- Speculative defensive programming
-- Premature scalability engineering
-- Unnecessary indirection layer creation
-- Abstract base class implementation without clear inheritance requirements
-- Comprehensive logging and monitoring system implementation without specification
+def _install_command_files(package: str, suffix: str, commands_dir: Path) -> List[str]:
+    """Install the packaged command files into ``commands_dir``.
 
-### Decision Framework Protocol
+    Files are first copied into a staging directory next to ``commands_dir``
+    and then moved into place with ``os.replace``, so an interrupted install
+    never leaves a half-written command file behind.
+
+    Returns:
+        List of installed file names
+    """
+    command_files = _package_command_files(package, suffix)
+    with tempfile.TemporaryDirectory(dir=commands_dir.parent) as staging:
+        staging_dir = Path(staging)
+        # Copy files concurrently; list() re-raises the first copy error
+        with ThreadPoolExecutor(max_workers=INSTALL_WORKERS) as pool:
+            list(
+                pool.map(
+                    functools.partial(_copy_command_file, commands_dir=staging_dir),
+                    command_files,
+                )
+            )
+        for command_file in command_files:
+            os.replace(
+                staging_dir / command_file.name, commands_dir / command_file.name
+            )
+    return [command_file.name for command_file in command_files]
+
+
+def _copy_command_file(command_file: Traversable, commands_dir: Path) -> None:
+    """Copy a packaged command file into ``commands_dir``.
+
+    ``as_file`` yields the real path for regular installs, so ``copyfile`` can
+    use the kernel fast path (``sendfile``) without reading the file into
+    Python. Zipped installs fall back to a temporary extracted copy.
+    """
+    with importlib.resources.as_file(command_file) as source:
+        shutil.copyfile(source, commands_dir / command_file.name)
 
-When evaluating implementation decisions, apply the following sequential evaluation criteria:
 
-1. **Simplicity Assessment**: Does the solution minimize cognitive complexity and maximize comprehensibility?
-2. **Requirement Necessity**: Is this functionality required for current specifications rather than hypothetical future needs?
-3. **Duplication Analysis**: Does the implementation create obvious and problematic code repetition?
-4. **Responsibility Clarity**: Does the implementation maintain a single, well-defined purpose?
+def _read_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    # json detects the encoding of bytes itself, saving a separate decode
+    return json.loads(path.read_bytes())
 
-**Default Resolution Protocol**: Select the simplest implementation that satisfies immediate problem requirements without additional complexity.
 
----
-"""
+def _loads_json(text: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """Write ``data`` as indented JSON, using orjson when it is installed.
+
+    The file is written to a temporary file in the same directory and moved
+    into place with ``os.replace``, so a crash never leaves it half-written.
+    Symlinks are resolved first, so a linked file (e.g. managed by stow) is
+    updated at its target instead of being replaced by a regular file.
+    """
+    path = path.resolve()
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2).encode("utf-8")
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def _validate_config_path(path, allowed_dirs=None):
@@ -672,7 +908,6 @@ def _validate_config_path(path, allowed_dirs=None):
     Raises:
         ValueError: If path is unsafe or outside allowed directories
     """
-    from pathlib import Path
 
     if allowed_dirs is None:
         allowed_dirs = [".codex", ".claude", ".gemini"]
@@ -698,10 +933,30 @@ def _validate_config_path(path, allowed_dirs=None):
         return resolved_path
 
     except Exception as e:
-        logger.error(f"Path validation failed for {path}: {e}")
+        logger.error("Path validation failed for %s: %s", path, e)
         raise ValueError(f"Invalid or unsafe path: {path}") from e
 
 
+# Heading that marks a file as already containing the code memory guidelines
+CODE_MEMORY_MARKER = b"Simplicity-First Design Principles"
+
+
+def _file_contains(f: BinaryIO, needle: bytes, chunk_size: int = 1 << 16) -> bool:
+    """Return whether the open file ``f`` contains ``needle``, reading it in chunks.
+
+    Reading starts at the current position. Consecutive chunks overlap by
+    ``len(needle) - 1`` bytes so a match that spans a chunk boundary is
+    still found.
+    """
+    tail = b""
+    while chunk := f.read(chunk_size):
+        window = tail + chunk
+        if needle in window:
+            return True
+        tail = window[-(len(needle) - 1) :] if len(needle) > 1 else b""
+    return False
+
+
 def _append_code_memory_to_file(file_path):
     """
     Append code memory content to a file with idempotency check.
@@ -712,7 +967,6 @@ def _append_code_memory_to_file(file_path):
     Returns:
         bool: True if content was added, False if already exists or on error
     """
-    from datetime import datetime
 
     try:
         # Validate path security before proceeding
@@ -721,72 +975,109 @@ def _append_code_memory_to_file(file_path):
         # Create parent directories if they don't exist
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check if content already exists (idempotency)
-        if file_path.exists():
-            existing_content = file_path.read_text()
-            if "Simplicity-First Design Principles" in existing_content:
-                logger.debug(f"Code memory content already exists in {file_path}")
+        # Open once for both the idempotency check and the append; "a+b"
+        # creates the file if needed and always writes at the end
+        with file_path.open("a+b") as f:
+            f.seek(0)
+            if _file_contains(f, CODE_MEMORY_MARKER):
+                logger.debug("Code memory content already exists in %s", file_path)
                 return False
 
-        # Prepare content with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        content_to_add = CODE_MEMORY_CONTENT.format(timestamp=timestamp)
+            content_to_add = _code_memory_content()
 
-        # Append content to file
-        with file_path.open("a", encoding="utf-8") as f:
-            if file_path.exists() and file_path.stat().st_size > 0:
-                f.write("\n")  # Add newline if file has content
-            f.write(content_to_add)
+            # The scan stopped at the end, so tell() is the existing size
+            if f.tell() > 0:
+                f.write(b"\n")  # Add newline if file has content
+            f.write(content_to_add.encode("utf-8"))
 
-        logger.debug(f"Code memory content appended to {file_path}")
+        logger.debug("Code memory content appended to %s", file_path)
         return True
 
     except ValueError as e:
-        logger.warning(f"Invalid path for code memory file: {e}")
+        logger.warning("Invalid path for code memory file: %s", e)
         print(f"❌ Invalid path: {e}")
         return False
     except PermissionError:
-        logger.warning(f"Permission denied writing to {file_path}")
+        logger.warning("Permission denied writing to %s", file_path)
         print(f"⚠️  Could not write to {file_path} (permission denied)")
         return False
     except OSError as e:
-        logger.warning(f"Error writing to {file_path}: {e}")
+        logger.warning("Error writing to %s: %s", file_path, e)
         print(f"⚠️  Could not write to {file_path}: {e}")
         return False
     except Exception as e:
-        logger.error(f"Unexpected error writing to {file_path}: {e}")
+        logger.error("Unexpected error writing to %s: %s", file_path, e)
         print(f"❌ Unexpected error writing to {file_path}: {e}")
         return False
 
 
+# Seconds to wait for an external CLI (e.g. ``claude mcp add``) to finish
+CLI_TIMEOUT = 30
+
+
+# Closing banner printed by each installer, written with a single print()
+NEXT_STEPS_TEMPLATE = """
+🎯 Setup completed! Next steps:
+1. Configure a Git platform:
+   git-mcp config add my-gitlab gitlab --url https://gitlab.com
+
+2. Test the connection:
+   git-mcp config test my-gitlab
+
+3. Use the issue-to-code workflow in {agent}:
+   /issue <issue-url>
+   /plan
+   /implement
+   /test
+   /doc
+   /pr <issue-id>
+
+🎉 Happy issue-driven coding{sign_off}!"""
+
+CLAUDE_NEXT_STEPS = NEXT_STEPS_TEMPLATE.format(agent="Claude Code", sign_off="")
+GEMINI_NEXT_STEPS = NEXT_STEPS_TEMPLATE.format(
+    agent="Gemini CLI", sign_off=" with Gemini"
+)
+CODEX_NEXT_STEPS = NEXT_STEPS_TEMPLATE.format(agent="Codex", sign_off=" with Codex")
+
+
 def install_claude_integration():
     """Install Claude Code integration and slash commands."""
-    import subprocess
-    import shutil
-    from pathlib import Path
 
     print("🔧 Setting up Git MCP Server with Claude Code...")
 
-    # Check if claude command is available
-    if not shutil.which("claude"):
+    # Check if claude command is available, keeping its path for the calls below
+    claude_path = shutil.which("claude")
+    if not claude_path:
         print("❌ Claude Code CLI is not installed.")
         print("   Please install Claude Code first: https://claude.ai/code")
         return
 
     # Add MCP server to Claude Code
     print("📦 Adding MCP server to Claude Code (user scope)...")
+    add_command = [
+        claude_path,
+        "mcp",
+        "add",
+        "-s",
+        "user",
+        "git-mcp-server",
+        "git-mcp-server",
+    ]
     try:
-        # First try to remove if exists, then add
-        subprocess.run(
-            ["claude", "mcp", "remove", "git-mcp-server"],
-            capture_output=True,  # Don't show error if doesn't exist
-        )
-        subprocess.run(
-            ["claude", "mcp", "add", "-s", "user", "git-mcp-server", "git-mcp-server"],
-            check=True,
+        # Try adding first; only spawn a remove when the server already exists
+        result = subprocess.run(
+            add_command, capture_output=True, text=True, timeout=CLI_TIMEOUT
         )
+        if result.returncode != 0:
+            subprocess.run(
+                [claude_path, "mcp", "remove", "git-mcp-server"],
+                capture_output=True,  # Don't show error if doesn't exist
+                timeout=CLI_TIMEOUT,
+            )
+            subprocess.run(add_command, check=True, timeout=CLI_TIMEOUT)
         print("✅ MCP server added successfully")
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         print(f"❌ Failed to add MCP server: {e}")
         return
 
@@ -795,25 +1086,16 @@ def install_claude_integration():
 
     # Get slash commands from package data
     try:
-        import importlib.resources
-
         commands_dir = Path.home() / ".claude" / "commands"
         commands_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy slash command files
         try:
-            claude_commands_ref = importlib.resources.files("git_mcp.claude_commands")
-            if claude_commands_ref.is_dir():
-                for command_file in claude_commands_ref.iterdir():
-                    if command_file.name.endswith(".md"):
-                        target_file = commands_dir / command_file.name
-                        target_file.write_text(command_file.read_text())
-                        print(f"   Installed: {command_file.name}")
-                print("✅ Slash commands installed successfully")
-            else:
-                raise FileNotFoundError(
-                    "Claude commands directory not found in package"
-                )
+            for name in _install_command_files(
+                "git_mcp.claude_commands", ".md", commands_dir
+            ):
+                print(f"   Installed: {name}")
+            print("✅ Slash commands installed successfully")
         except Exception as e:
             print(f"❌ Failed to install Claude commands from package: {e}")
             print("   Please check that the package was installed correctly")
@@ -831,26 +1113,11 @@ def install_claude_integration():
     else:
         print(f"ℹ️  Code memory guidelines already present in {claude_config_file}")
 
-    print("\n🎯 Setup completed! Next steps:")
-    print("1. Configure a Git platform:")
-    print("   git-mcp config add my-gitlab gitlab --url https://gitlab.com")
-    print("\n2. Test the connection:")
-    print("   git-mcp config test my-gitlab")
-    print("\n3. Use the issue-to-code workflow in Claude Code:")
-    print("   /issue <issue-url>")
-    print("   /plan")
-    print("   /implement")
-    print("   /test")
-    print("   /doc")
-    print("   /pr <issue-id>")
-    print("\n🎉 Happy issue-driven coding!")
+    print(CLAUDE_NEXT_STEPS)
 
 
 def install_gemini_integration():
     """Install Gemini CLI integration and slash commands."""
-    import json
-    import shutil
-    from pathlib import Path
 
     print("🔧 Setting up Git MCP Server with Gemini CLI...")
 
@@ -864,6 +1131,10 @@ def install_gemini_integration():
 
     # Get Gemini settings path
     gemini_settings_path = Path.home() / ".gemini" / "settings.json"
+    commands_dir = gemini_settings_path.parent / "commands"
+
+    # Creating the commands directory also creates ~/.gemini for the settings
+    commands_dir.mkdir(parents=True, exist_ok=True)
 
     print("📦 Adding MCP server to Gemini CLI...")
 
@@ -871,7 +1142,7 @@ def install_gemini_integration():
     settings = {}
     if gemini_settings_path.exists():
         try:
-            settings = json.loads(gemini_settings_path.read_text())
+            settings = _read_json_file(gemini_settings_path)
         except Exception as e:
             print(f"⚠️  Could not parse existing settings: {e}")
 
@@ -879,8 +1150,7 @@ def install_gemini_integration():
     if "mcpServers" not in settings:
         settings["mcpServers"] = {}
 
-    # Add our MCP server configuration
-    settings["mcpServers"]["git-mcp-server"] = {
+    server_config = {
         "command": "git-mcp-server",
         "args": [],
         "env": {},
@@ -888,36 +1158,30 @@ def install_gemini_integration():
         "trust": True,  # Trust our tools to avoid confirmation prompts
     }
 
-    # Create settings directory if it doesn't exist
-    gemini_settings_path.parent.mkdir(parents=True, exist_ok=True)
+    if settings["mcpServers"].get("git-mcp-server") == server_config:
+        # Already up to date, skip rewriting the settings file
+        print("✅ MCP server already present in Gemini settings")
+    else:
+        # Add our MCP server configuration
+        settings["mcpServers"]["git-mcp-server"] = server_config
 
-    # Write updated settings
-    try:
-        gemini_settings_path.write_text(json.dumps(settings, indent=2))
-        print("✅ MCP server added successfully to Gemini settings")
-    except Exception as e:
-        print(f"❌ Failed to update Gemini settings: {e}")
-        return
+        # Write updated settings
+        try:
+            _write_json_file(gemini_settings_path, settings)
+            print("✅ MCP server added successfully to Gemini settings")
+        except Exception as e:
+            print(f"❌ Failed to update Gemini settings: {e}")
+            return
 
     # Install slash commands for Gemini
     print("📋 Installing issue-to-code workflow slash commands for Gemini...")
 
-    commands_dir = Path.home() / ".gemini" / "commands"
-    commands_dir.mkdir(parents=True, exist_ok=True)
-
     # Get Gemini commands from package data
     try:
-        import importlib.resources
-
-        gemini_commands_ref = importlib.resources.files("git_mcp.gemini_commands")
-        if gemini_commands_ref.is_dir():
-            for command_file in gemini_commands_ref.iterdir():
-                if command_file.name.endswith(".toml"):
-                    target_file = commands_dir / command_file.name
-                    target_file.write_text(command_file.read_text())
-                    print(f"   Installed: {command_file.name}")
-        else:
-            raise FileNotFoundError("Gemini commands directory not found in package")
+        for name in _install_command_files(
+            "git_mcp.gemini_commands", ".toml", commands_dir
+        ):
+            print(f"   Installed: {name}")
     except Exception as e:
         print(f"❌ Failed to install Gemini commands from package: {e}")
         print("   Please check that the package was installed correctly")
@@ -931,19 +1195,7 @@ def install_gemini_integration():
     else:
         print(f"ℹ️  Code memory guidelines already present in {gemini_config_file}")
 
-    print("\n🎯 Setup completed! Next steps:")
-    print("1. Configure a Git platform:")
-    print("   git-mcp config add my-gitlab gitlab --url https://gitlab.com")
-    print("\n2. Test the connection:")
-    print("   git-mcp config test my-gitlab")
-    print("\n3. Use the issue-to-code workflow in Gemini CLI:")
-    print("   /issue <issue-url>")
-    print("   /plan")
-    print("   /implement")
-    print("   /test")
-    print("   /doc")
-    print("   /pr <issue-id>")
-    print("\n🎉 Happy issue-driven coding with Gemini!")
+    print(GEMINI_NEXT_STEPS)
 
 
 def install_codex_integration() -> None:
@@ -959,7 +1211,6 @@ def install_codex_integration() -> None:
     The integration follows the same pattern as Claude Code and Gemini CLI
     integrations but adapts to Codex's specific configuration requirements.
     """
-    import shutil
 
     print("🔧 Setting up Git MCP Server with Codex...")
 
@@ -986,19 +1237,35 @@ def install_codex_integration() -> None:
     print("📝 Adding code memory guidelines to Codex configuration...")
     _update_codex_agents_memory()
 
-    print("\n🎯 Setup completed! Next steps:")
-    print("1. Configure a Git platform:")
-    print("   git-mcp config add my-gitlab gitlab --url https://gitlab.com")
-    print("\n2. Test the connection:")
-    print("   git-mcp config test my-gitlab")
-    print("\n3. Use the issue-to-code workflow in Codex:")
-    print("   /issue <issue-url>")
-    print("   /plan")
-    print("   /implement")
-    print("   /test")
-    print("   /doc")
-    print("   /pr <issue-id>")
-    print("\n🎉 Happy issue-driven coding with Codex!")
+    print(CODEX_NEXT_STEPS)
+
+
+@functools.lru_cache(maxsize=None)
+def _toml_modules() -> Tuple[Any, Any]:
+    """Import and return the TOML ``(loader, writer)`` modules.
+
+    The imports are deferred until Codex is configured and then cached, so
+    only the first call pays for them. Failed imports are not cached.
+    """
+    try:
+        # Python 3.11+ ships tomllib; fall back to tomli on older versions
+        loader = importlib.import_module("tomllib")
+    except ImportError:
+        try:
+            loader = importlib.import_module("tomli")
+        except ImportError:
+            raise ImportError(
+                "TOML support not available. Please install tomli: pip install tomli"
+            ) from None
+
+    try:
+        writer = importlib.import_module("tomli_w")
+    except ImportError:
+        raise ImportError(
+            "TOML writing support not available. Please install tomli-w: pip install tomli-w"
+        ) from None
+
+    return loader, writer
 
 
 def _configure_codex_mcp_server() -> bool:
@@ -1020,31 +1287,12 @@ def _configure_codex_mcp_server() -> bool:
     args = []
     env = {}
     """
-    from pathlib import Path
 
     try:
-        # Import TOML handling libraries with graceful fallbacks
         try:
-            # Try Python 3.11+ built-in tomllib first
-            from importlib import import_module
-
-            tomllib = import_module("tomllib")
-        except ImportError:
-            try:
-                # Fallback to tomli for older Python versions
-                tomllib = import_module("tomli")
-            except ImportError:
-                print(
-                    "❌ TOML support not available. Please install tomli: pip install tomli"
-                )
-                return False
-
-        try:
-            import tomli_w
-        except ImportError:
-            print(
-                "❌ TOML writing support not available. Please install tomli-w: pip install tomli-w"
-            )
+            tomllib, tomli_w = _toml_modules()
+        except ImportError as e:
+            print(f"❌ {e}")
             return False
 
         # Use secure path validation for config file
@@ -1059,9 +1307,9 @@ def _configure_codex_mcp_server() -> bool:
             try:
                 config_content = config_file.read_text(encoding="utf-8")
                 config = tomllib.loads(config_content)
-                logger.debug(f"Loaded existing Codex config from {config_file}")
+                logger.debug("Loaded existing Codex config from %s", config_file)
             except FileNotFoundError:
-                logger.debug(f"Config file {config_file} not found, creating new")
+                logger.debug("Config file %s not found, creating new", config_file)
             except PermissionError:
                 print(f"❌ Permission denied reading {config_file}")
                 return False
@@ -1073,7 +1321,7 @@ def _configure_codex_mcp_server() -> bool:
                 print(f"❌ Invalid encoding in {config_file}: {e}")
                 return False
             except Exception as e:
-                logger.warning(f"Unexpected error reading {config_file}: {e}")
+                logger.warning("Unexpected error reading %s: %s", config_file, e)
                 print(f"⚠️  Could not parse existing config.toml: {e}")
                 print("   Continuing with empty configuration...")
 
@@ -1081,18 +1329,25 @@ def _configure_codex_mcp_server() -> bool:
         if "mcp_servers" not in config:
             config["mcp_servers"] = {}
 
-        # Add our MCP server configuration
-        config["mcp_servers"]["git-mcp-server"] = {
+        server_config = {
             "command": "git-mcp-server",
             "args": [],
             "env": {},
         }
+        # Leave the file untouched when it is already up to date
+        if config["mcp_servers"].get("git-mcp-server") == server_config:
+            print("✅ MCP server already present in Codex configuration")
+            return True
+
+        # Add our MCP server configuration
+        config["mcp_servers"]["git-mcp-server"] = server_config
 
         # Write updated config with proper error handling
         try:
-            config_content = tomli_w.dumps(config)
-            config_file.write_text(config_content, encoding="utf-8")
-            logger.debug(f"Updated Codex config at {config_file}")
+            # tomli_w writes UTF-8 bytes straight into the file
+            with config_file.open("wb") as f:
+                tomli_w.dump(config, f)
+            logger.debug("Updated Codex config at %s", config_file)
         except PermissionError:
             print(f"❌ Permission denied writing to {config_file}")
             return False
@@ -1133,35 +1388,27 @@ def _install_codex_commands() -> bool:
     - doc.md: Documentation updates
     - pr.md: Pull request creation
     """
-    from pathlib import Path
 
     try:
-        import importlib.resources
-
         # Create Codex prompts directory with secure path validation
         commands_dir = _validate_config_path(Path.home() / ".codex" / "prompts")
         commands_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy slash command files from package
         try:
-            codex_commands_ref = importlib.resources.files("git_mcp.codex_commands")
-            if codex_commands_ref.is_dir():
-                command_count = 0
-                for command_file in codex_commands_ref.iterdir():
-                    if command_file.name.endswith(".md"):
-                        target_file = commands_dir / command_file.name
-                        target_file.write_text(command_file.read_text())
-                        print(f"   Installed: {command_file.name}")
-                        command_count += 1
-
-                if command_count > 0:
-                    print(f"✅ {command_count} slash commands installed successfully")
-                    return True
-                else:
-                    print("⚠️  No command files found in package")
-                    return False
+            installed = _install_command_files(
+                "git_mcp.codex_commands", ".md", commands_dir
+            )
+            for name in installed:
+                print(f"   Installed: {name}")
+            command_count = len(installed)
+
+            if command_count > 0:
+                print(f"✅ {command_count} slash commands installed successfully")
+                return True
             else:
-                raise FileNotFoundError("Codex commands directory not found in package")
+                print("⚠️  No command files found in package")
+                return False
 
         except Exception as e:
             print(f"❌ Failed to install Codex commands from package: {e}")
@@ -1192,7 +1439,6 @@ def _update_codex_agents_memory() -> bool:
     The guidelines help Codex understand project conventions and generate
     code that follows established patterns and best practices.
     """
-    from pathlib import Path
 
     codex_agents_file = Path.home() / ".codex" / "AGENTS.md"
     if _append_code_memory_to_file(codex_agents_file):
@@ -1,11 +1,59 @@
 """Base platform adapter for git-mcp."""
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
+# Default number of keep-alive connections each adapter holds per host
+DEFAULT_POOL_SIZE = 20
+
+
+def connection_pool_size() -> int:
+    """Return the per-host HTTP connection pool size from ``GIT_MCP_MAX_CONNECTIONS``."""
+    try:
+        return max(1, int(os.getenv("GIT_MCP_MAX_CONNECTIONS", "")))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def request_timeout() -> int:
+    """Return the HTTP request timeout in seconds (``defaults.timeout`` in config)."""
+    # Imported here: core.config imports the adapters lazily as well
+    from ..core.config import get_config
+
+    return get_config().defaults.timeout
+
+
+# Default bounds on the merge request diffs returned to clients
+DEFAULT_DIFF_MAX_FILES = 100
+DEFAULT_DIFF_MAX_BYTES = 1_000_000
+
+
+class DiffBudget:
+    """Bounds how much of a merge request diff is returned.
+
+    At most ``max_files`` files are listed, and diff content is included
+    until ``max_bytes`` (UTF-8) have been returned; later files are listed
+    without their diff. ``truncated`` records whether anything was left out.
+    """
+
+    def __init__(self, options: Dict[str, Any]):
+        self.max_files = int(options.get("max_files") or DEFAULT_DIFF_MAX_FILES)
+        self.remaining_bytes = int(options.get("max_bytes") or DEFAULT_DIFF_MAX_BYTES)
+        self.truncated = False
+
+    def fits(self, diff: str) -> bool:
+        """Return whether ``diff`` fits in the budget, and charge it if so."""
+        size = len(diff.encode("utf-8"))
+        if size > self.remaining_bytes:
+            self.truncated = True
+            return False
+        self.remaining_bytes -= size
+        return True
+
 
 class ResourceType(Enum):
     """Types of Git platform resources."""
@@ -321,7 +369,20 @@ class PlatformAdapter(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release the underlying HTTP session, if any."""
+        pass
+
     # Utility methods
+    def _limit_from_filters(self, filters: Dict[str, Any]) -> Optional[int]:
+        """Return the maximum number of items requested by ``limit``/``per_page``.
+
+        ``None`` means no limit. Adapters pass the result to ``itertools.islice``
+        so paginated listings stop fetching pages once the limit is reached.
+        """
+        limit = filters.get("limit") or filters.get("per_page")
+        return int(limit) if limit else None
+
     def _normalize_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize filter parameters for platform-specific format."""
         return filters
@@ -347,5 +408,4 @@ class PlatformAdapter(ABC):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        # Cleanup if needed
-        pass
+        self.close()
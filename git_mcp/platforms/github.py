@@ -1,16 +1,20 @@
 """GitHub platform adapter for git-mcp."""
 
 from github import Github, GithubException, BadCredentialsException
+from itertools import islice
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from .base import (
+    DiffBudget,
     PlatformAdapter,
     ProjectResource,
     IssueResource,
     MergeRequestResource,
     ResourceType,
     ResourceState,
+    connection_pool_size,
+    request_timeout,
 )
 from ..core.exceptions import (
     AuthenticationError,
@@ -19,6 +23,10 @@ from ..core.exceptions import (
     NetworkError,
 )
 
+# Largest page size accepted by the GitHub REST API; PyGithub defaults to 30,
+# so listings of up to 100 items take one request instead of four
+MAX_PER_PAGE = 100
+
 
 class GitHubAdapter(PlatformAdapter):
     """GitHub platform adapter using PyGithub."""
@@ -52,10 +60,21 @@ class GitHubAdapter(PlatformAdapter):
 
         try:
             if self._base_url == "https://api.github.com":
-                self.client = Github(self.token)
+                self.client = Github(
+                    self.token,
+                    timeout=request_timeout(),
+                    per_page=MAX_PER_PAGE,
+                    pool_size=connection_pool_size(),
+                )
             else:
                 # GitHub Enterprise
-                self.client = Github(base_url=self._base_url, login_or_token=self.token)
+                self.client = Github(
+                    base_url=self._base_url,
+                    login_or_token=self.token,
+                    timeout=request_timeout(),
+                    per_page=MAX_PER_PAGE,
+                    pool_size=connection_pool_size(),
+                )
 
             # Test authentication by getting current user
             self.client.get_user()
@@ -66,6 +85,13 @@ class GitHubAdapter(PlatformAdapter):
         except Exception as e:
             raise NetworkError(f"Failed to connect to GitHub: {e}")
 
+    def close(self) -> None:
+        """Close the GitHub client's HTTP session."""
+        if self.client:
+            self.client.close()
+            self.client = None
+            self._authenticated = False
+
     async def test_connection(self) -> bool:
         """Test connection to GitHub."""
         if not self.client:
@@ -96,9 +122,14 @@ class GitHubAdapter(PlatformAdapter):
                 # Default: all accessible repos
                 repos = user.get_repos()
 
-            # Apply additional filters
+            # Apply additional filters, stopping once the limit is reached so
+            # the paginated list does not fetch further pages
+            limit = self._limit_from_filters(filters)
             result_repos = []
             for repo in repos:
+                if limit and len(result_repos) >= limit:
+                    break
+
                 if filters.get("archived") is not None:
                     if repo.archived != filters["archived"]:
                         continue
@@ -180,12 +211,13 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             github_filters = self._normalize_issue_filters(filters)
             issues = repo.get_issues(**github_filters)
 
             return [
-                self._convert_to_issue_resource(issue, project_id) for issue in issues
+                self._convert_to_issue_resource(issue, project_id)
+                for issue in islice(issues, self._limit_from_filters(filters))
             ]
         except GithubException as e:
             raise PlatformError(f"Failed to list issues: {e}", self.platform_name)
@@ -216,7 +248,7 @@ class GitHubAdapter(PlatformAdapter):
             if "labels" in filters:
                 labels = filters["labels"]
                 if isinstance(labels, str):
-                    labels = [labels]
+                    labels = labels.split(",")
                 for label in labels:
                     query_parts.append(f'label:"{label}"')
 
@@ -235,7 +267,7 @@ class GitHubAdapter(PlatformAdapter):
                 self._convert_to_issue_resource(
                     issue, self._extract_repo_name(issue.repository.full_name)
                 )
-                for issue in issues
+                for issue in islice(issues, self._limit_from_filters(filters))
             ]
         except GithubException as e:
             raise PlatformError(f"Failed to search issues: {e}", self.platform_name)
@@ -248,7 +280,7 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             issue = repo.get_issue(int(issue_id))
 
             # Get issue comments
@@ -299,7 +331,7 @@ class GitHubAdapter(PlatformAdapter):
             if "labels" in kwargs:
                 labels = kwargs["labels"]
                 if isinstance(labels, str):
-                    labels = [labels]
+                    labels = labels.split(",")
                 issue_kwargs["labels"] = labels
             if "assignee" in kwargs:
                 issue_kwargs["assignee"] = kwargs["assignee"]
@@ -328,7 +360,7 @@ class GitHubAdapter(PlatformAdapter):
             if "labels" in kwargs:
                 labels = kwargs["labels"]
                 if isinstance(labels, str):
-                    labels = [labels]
+                    labels = labels.split(",")
                 update_kwargs["labels"] = labels
             if "assignee" in kwargs:
                 update_kwargs["assignee"] = kwargs["assignee"]
@@ -389,11 +421,14 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             github_filters = self._normalize_pr_filters(filters)
             prs = repo.get_pulls(**github_filters)
 
-            return [self._convert_to_mr_resource(pr, project_id) for pr in prs]
+            return [
+                self._convert_to_mr_resource(pr, project_id)
+                for pr in islice(prs, self._limit_from_filters(filters))
+            ]
         except GithubException as e:
             raise PlatformError(
                 f"Failed to list pull requests: {e}", self.platform_name
@@ -407,7 +442,7 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             pr = repo.get_pull(int(mr_id))
             return self._convert_to_mr_resource(pr, project_id)
         except GithubException as e:
@@ -622,7 +657,7 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             branches = repo.get_branches()
 
             return [
@@ -652,7 +687,7 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             tags = repo.get_tags()
 
             return [
@@ -677,7 +712,7 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
 
             # Apply filters
             commit_kwargs = {}
@@ -820,15 +855,16 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             pr = repo.get_pull(int(mr_id))
 
             # Get diff format option (default: json)
             diff_format = options.get("format", "json")
             include_diff = options.get("include_diff", True)
+            budget = DiffBudget(options)
 
-            # Get files changed in the PR
-            files = list(pr.get_files())
+            # Get files changed in the PR, only fetching the pages needed
+            files = list(islice(pr.get_files(), budget.max_files))
 
             # Initialize response structure
             response = {
@@ -836,7 +872,7 @@ class GitHubAdapter(PlatformAdapter):
                 "total_changes": {
                     "additions": pr.additions,
                     "deletions": pr.deletions,
-                    "files_changed": len(files),
+                    "files_changed": pr.changed_files,
                 },
                 "files": [],
                 "diff_format": diff_format,
@@ -861,11 +897,13 @@ class GitHubAdapter(PlatformAdapter):
                     and not file_info["binary"]
                     and hasattr(file, "patch")
                     and file.patch
+                    and budget.fits(file.patch)
                 ):
                     file_info["diff"] = file.patch
 
                 response["files"].append(file_info)
 
+            response["truncated"] = budget.truncated or pr.changed_files > len(files)
             return response
 
         except GithubException as e:
@@ -883,7 +921,7 @@ class GitHubAdapter(PlatformAdapter):
             await self.authenticate()
 
         try:
-            repo = self.client.get_repo(project_id)
+            repo = self._lazy_repo(project_id)
             pr = repo.get_pull(int(mr_id))
 
             # Get commits from the pull request
@@ -957,6 +995,15 @@ class GitHubAdapter(PlatformAdapter):
             return {"branch": branch_ref, "is_cross_repo": False}  # type: ignore[dict-item]
 
     # Helper methods
+    def _lazy_repo(self, project_id: str):
+        """Return a repository handle without fetching the repository.
+
+        Reading a pull request, issue or listing through it then takes one
+        request instead of two; repository attributes are still fetched on
+        first access.
+        """
+        return self.client.get_repo(project_id, lazy=True)
+
     def _convert_to_project_resource(self, repo) -> ProjectResource:
         """Convert GitHub repository to ProjectResource."""
         return ProjectResource(
@@ -1083,7 +1130,10 @@ class GitHubAdapter(PlatformAdapter):
                     github_filters["state"] = "open"
                 elif key == "labels":
                     if isinstance(value, str):
-                        github_filters["labels"] = [value]  # type: ignore
+                        # "bug, ui" is two labels, as on the GitLab side
+                        github_filters["labels"] = [  # type: ignore
+                            label.strip() for label in value.split(",") if label.strip()
+                        ]
                     else:
                         github_filters["labels"] = value
                 else:
@@ -2,18 +2,27 @@
 
 import gitlab
 import logging
+import requests
+import threading
+from collections import OrderedDict
+from itertools import islice
 from gitlab.exceptions import GitlabError, GitlabAuthenticationError
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from typing import Dict, List, NamedTuple, Optional, Any
 from datetime import datetime
 from urllib.parse import urlparse
 
 from .base import (
+    DiffBudget,
     PlatformAdapter,
     ProjectResource,
     IssueResource,
     MergeRequestResource,
     ResourceType,
     ResourceState,
+    connection_pool_size,
+    request_timeout,
 )
 from ..core.exceptions import (
     AuthenticationError,
@@ -24,6 +33,132 @@ from ..core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Number of GET responses kept for ETag revalidation per adapter
+ETAG_CACHE_SIZE = 256
+# Total response body bytes kept for ETag revalidation per adapter
+ETAG_CACHE_BYTES = 8 * 1024 * 1024
+# Bodies larger than this (e.g. big MR diffs) are never kept
+ETAG_MAX_BODY_BYTES = 512 * 1024
+
+
+class _StoredResponse(NamedTuple):
+    """The parts of a GET response needed to answer a later 304."""
+
+    url: str
+    headers: Dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+
+
+class ConditionalRequestAdapter(HTTPAdapter):
+    """HTTP adapter that revalidates repeated GET requests with ETags.
+
+    GET responses carrying an ``ETag`` are kept, and the next request for the
+    same URL is sent with ``If-None-Match``. When the server answers
+    ``304 Not Modified`` the stored response is returned instead, so an
+    unchanged page is not transferred again.
+
+    Only the body and headers are kept, bounded both by entry count and by
+    total body size; bodies over ``max_body_bytes`` are not kept at all.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        cache_size: int = ETAG_CACHE_SIZE,
+        cache_bytes: int = ETAG_CACHE_BYTES,
+        max_body_bytes: int = ETAG_MAX_BODY_BYTES,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.cache_size = cache_size
+        self.cache_bytes = cache_bytes
+        self.max_body_bytes = max_body_bytes
+        self._responses: "OrderedDict[str, _StoredResponse]" = OrderedDict()
+        self._stored_bytes = 0
+        # Adapter calls run in worker threads that share this session
+        self._lock = threading.Lock()
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):
+        if (
+            request.method != "GET"
+            or kwargs.get("stream")
+            or "If-None-Match" in request.headers
+        ):
+            return super().send(request, **kwargs)
+
+        url = request.url or ""
+        with self._lock:
+            cached = self._responses.get(url)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached.headers["ETag"]
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            with self._lock:
+                if url in self._responses:
+                    self._responses.move_to_end(url)
+            return self._rebuild(cached, request, response)
+
+        if response.status_code == 200 and "ETag" in response.headers:
+            # Reading the body also releases the connection back to the pool
+            content = response.content
+            if len(content) <= self.max_body_bytes:
+                self._remember(
+                    url,
+                    _StoredResponse(
+                        response.url or url,
+                        dict(response.headers),
+                        content,
+                        response.encoding,
+                    ),
+                )
+        return response
+
+    def _remember(self, url: str, stored: _StoredResponse) -> None:
+        with self._lock:
+            previous = self._responses.pop(url, None)
+            if previous is not None:
+                self._stored_bytes -= len(previous.content)
+            self._responses[url] = stored
+            self._stored_bytes += len(stored.content)
+            while self._responses and (
+                len(self._responses) > self.cache_size
+                or self._stored_bytes > self.cache_bytes
+            ):
+                _, evicted = self._responses.popitem(last=False)
+                self._stored_bytes -= len(evicted.content)
+
+    def _rebuild(
+        self,
+        stored: _StoredResponse,
+        request: requests.PreparedRequest,
+        not_modified: requests.Response,
+    ) -> requests.Response:
+        """Turn a stored response into a fresh 200 for ``request``."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(stored.headers)
+        response._content = stored.content
+        response.encoding = stored.encoding
+        response.url = stored.url
+        response.request = request
+        response.elapsed = not_modified.elapsed
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self._stored_bytes = 0
+        super().close()
+
+
+# Largest page size accepted by the GitLab REST API
+MAX_PER_PAGE = 100
+
 
 class GitLabAdapter(PlatformAdapter):
     """GitLab platform adapter using python-gitlab."""
@@ -45,7 +180,9 @@ class GitLabAdapter(PlatformAdapter):
         # Warn about HTTP connections
         if parsed_url.scheme == "http":
             logger.warning(
-                f"Using insecure HTTP connection to {url}. Consider using HTTPS for production."
+                "Using insecure HTTP connection to %s. "
+                "Consider using HTTPS for production.",
+                url,
             )
 
         super().__init__(url, token, username)
@@ -68,7 +205,11 @@ class GitLabAdapter(PlatformAdapter):
 
             # Create GitLab client with SSL configuration
             self.client = gitlab.Gitlab(
-                self.url, private_token=self.token, ssl_verify=ssl_verify
+                self.url,
+                private_token=self.token,
+                ssl_verify=ssl_verify,
+                timeout=request_timeout(),
+                session=self._pooled_session(),
             )
             self.client.auth()
             self._authenticated = True
@@ -78,6 +219,26 @@ class GitLabAdapter(PlatformAdapter):
         except Exception as e:
             raise NetworkError(f"Failed to connect to GitLab: {e}")
 
+    def close(self) -> None:
+        """Close the GitLab client's HTTP session."""
+        if self.client:
+            self.client.session.close()
+            self.client = None
+            self._authenticated = False
+
+    @staticmethod
+    def _pooled_session() -> requests.Session:
+        """Create a session whose pool can keep concurrent calls' connections alive.
+
+        Repeated GET requests are revalidated with ETags (see
+        ``ConditionalRequestAdapter``).
+        """
+        session = requests.Session()
+        pool = ConditionalRequestAdapter(pool_maxsize=connection_pool_size())
+        session.mount("https://", pool)
+        session.mount("http://", pool)
+        return session
+
     async def test_connection(self) -> bool:
         """Test connection to GitLab."""
         if not self.client:
@@ -98,7 +259,11 @@ class GitLabAdapter(PlatformAdapter):
         try:
             # Convert common filters to GitLab format
             gitlab_filters = self._normalize_project_filters(filters)
-            projects = self.client.projects.list(all=True, **gitlab_filters)
+            projects = self._list_limited(
+                self.client.projects,
+                self._limit_from_filters(filters),
+                **gitlab_filters,
+            )
 
             return [self._convert_to_project_resource(p) for p in projects]
         except GitlabError as e:
@@ -156,7 +321,9 @@ class GitLabAdapter(PlatformAdapter):
         try:
             project = self.client.projects.get(project_id)
             gitlab_filters = self._normalize_issue_filters(filters)
-            issues = project.issues.list(all=True, **gitlab_filters)
+            issues = self._list_limited(
+                project.issues, self._limit_from_filters(filters), **gitlab_filters
+            )
 
             return [
                 self._convert_to_issue_resource(issue, project_id) for issue in issues
@@ -183,8 +350,6 @@ class GitLabAdapter(PlatformAdapter):
                     gitlab_filters = {
                         "scope": "assigned_to_me",
                         "state": gitlab_filters.get("state", "opened"),
-                        "all": False,
-                        "per_page": 100,
                     }
                     # Add other filters if present
                     if "labels" in gitlab_filters:
@@ -206,28 +371,37 @@ class GitLabAdapter(PlatformAdapter):
                             assignee_filter  # Keep for client-side filtering
                         )
 
-            # Use GitLab's global issues endpoint
-            issues = self.client.issues.list(**gitlab_filters)
+            limit = self._limit_from_filters(filters)
+            client_side_assignee = (
+                assignee_filter
+                and assignee_filter != self.username
+                and "assignee_id" not in gitlab_filters
+            )
+
+            # Use GitLab's global issues endpoint. When filtering client-side the
+            # limit applies after filtering, so pages are pulled until it is met.
+            issues = self._list_limited(
+                self.client.issues,
+                None if client_side_assignee else limit,
+                per_page=min(limit, MAX_PER_PAGE) if limit else None,
+                **gitlab_filters,
+            )
 
             # Convert to IssueResource objects
-            issue_resources = [
+            issue_resources = (
                 self._convert_to_issue_resource(issue, str(issue.project_id))
                 for issue in issues
-            ]
+            )
 
             # Apply client-side assignee filtering if needed (for non-current user cases where API filtering failed)
-            if (
-                assignee_filter
-                and assignee_filter != self.username
-                and "assignee_id" not in gitlab_filters
-            ):
-                issue_resources = [
+            if client_side_assignee:
+                issue_resources = (
                     issue
                     for issue in issue_resources
                     if issue.assignee == assignee_filter
-                ]
+                )
 
-            return issue_resources
+            return list(islice(issue_resources, limit))
         except GitlabError as e:
             raise PlatformError(f"Failed to list all issues: {e}", self.platform_name)
 
@@ -359,7 +533,11 @@ class GitLabAdapter(PlatformAdapter):
         try:
             project = self.client.projects.get(project_id)
             gitlab_filters = self._normalize_mr_filters(filters)
-            mrs = project.mergerequests.list(all=True, **gitlab_filters)
+            mrs = self._list_limited(
+                project.mergerequests,
+                self._limit_from_filters(filters),
+                **gitlab_filters,
+            )
 
             return [self._convert_to_mr_resource(mr, project_id) for mr in mrs]
         except GitlabError as e:
@@ -746,6 +924,7 @@ class GitLabAdapter(PlatformAdapter):
             # Get diff format option (default: json)
             diff_format = options.get("format", "json")
             include_diff = options.get("include_diff", True)
+            budget = DiffBudget(options)
 
             # Get changes using GitLab changes API
             changes = mr.changes()
@@ -764,7 +943,8 @@ class GitLabAdapter(PlatformAdapter):
             }
 
             # Process file changes
-            for change in changes.get("changes", []):
+            all_changes = changes.get("changes", [])
+            for change in islice(all_changes, budget.max_files):
                 file_info = {
                     "path": change.get("new_path") or change.get("old_path", ""),
                     "status": self._get_file_status(change),
@@ -774,11 +954,19 @@ class GitLabAdapter(PlatformAdapter):
                 }
 
                 # Include diff content if requested
-                if include_diff and not file_info["binary"]:
+                if (
+                    include_diff
+                    and not file_info["binary"]
+                    and budget.fits(change.get("diff", ""))
+                ):
                     file_info["diff"] = change.get("diff", "")
 
                 response["files"].append(file_info)
 
+            response["truncated"] = budget.truncated or len(all_changes) > len(
+                response["files"]
+            )
+
             # Try to get overall stats from MR
             if hasattr(mr, "changes_count"):
                 response["total_changes"]["files_changed"] = mr.changes_count
@@ -954,6 +1142,17 @@ class GitLabAdapter(PlatformAdapter):
             metadata=mr.asdict() if hasattr(mr, "asdict") else dict(mr),
         )
 
+    def _list_limited(self, manager, limit: Optional[int], **kwargs):
+        """List from a python-gitlab manager, fetching pages lazily up to ``limit``.
+
+        Uses ``iterator=True`` so only the pages needed to satisfy ``limit`` are
+        requested, instead of ``all=True`` which downloads every page.
+        """
+        page_size = kwargs.pop("per_page", None) or limit
+        if page_size:
+            kwargs["per_page"] = min(page_size, MAX_PER_PAGE)
+        return islice(manager.list(iterator=True, **kwargs), limit)
+
     def _normalize_project_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize project filters to GitLab format."""
         gitlab_filters = {}
@@ -1,19 +1,343 @@
 """Platform service - shared business logic for CLI and MCP."""
 
+import asyncio
+import functools
+import inspect
 import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
-from urllib.parse import urlparse
+import threading
+import weakref
+from dataclasses import astuple, dataclass
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
+from ..core.cache import TTLCache
 from ..core.config import get_config
 
 
+@dataclass(frozen=True, slots=True)
+class ListRequest:
+    """Normalized arguments of a list_* call.
+
+    Instances are immutable and hashable, so the same request always maps to
+    the same key. Extra filters are stored as a sorted tuple of pairs with
+    list values converted to tuples.
+    """
+
+    platform: str
+    project_id: Optional[str] = None
+    state: Optional[str] = None
+    limit: Optional[int] = None
+    filters: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        platform: str,
+        project_id: Optional[str] = None,
+        state: Optional[str] = None,
+        limit: Optional[int] = None,
+        **filters,
+    ) -> "ListRequest":
+        """Create a request from tool-style arguments."""
+        return cls(
+            platform=platform,
+            project_id=project_id,
+            state=state,
+            limit=limit,
+            filters=tuple(
+                sorted(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in filters.items()
+                )
+            ),
+        )
+
+    def adapter_filters(self) -> Dict[str, Any]:
+        """Return the keyword filters expected by the platform adapters."""
+        filters: Dict[str, Any] = {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in self.filters
+        }
+        if self.state is not None:
+            filters["state"] = self.state
+        if self.limit:
+            filters["per_page"] = self.limit
+        return filters
+
+
+# Issue URL path patterns, keyed by platform type
+_ISSUE_PATH_PATTERNS = {
+    # GitLab URL format: /group/subgroup/project/-/issues/123
+    "gitlab": re.compile(r"/([^/]+(?:/[^/]+)*?)/-/issues/(\d+)"),
+    # GitHub URL format: /user/repo/issues/123
+    "github": re.compile(r"/([^/]+/[^/]+)/issues/(\d+)"),
+}
+
+
+# Optional wrapper run around every adapter call in its worker thread, e.g.
+# to profile it (a main-thread profiler does not see worker threads)
+_worker_call_wrapper: Optional[Callable[[Callable[[], Any]], Any]] = None
+
+
+def set_worker_call_wrapper(
+    wrapper: Optional[Callable[[Callable[[], Any]], Any]],
+) -> None:
+    """Run every adapter call through ``wrapper`` in its worker thread.
+
+    ``wrapper`` receives a zero-argument callable and must return its result.
+    Pass ``None`` to remove it.
+    """
+    global _worker_call_wrapper
+    _worker_call_wrapper = wrapper
+
+
+class _ThreadedAdapter:
+    """Proxy that runs a platform adapter's coroutine methods in worker threads.
+
+    The adapters are ``async`` on the outside but call synchronous client
+    libraries (PyGithub, python-gitlab), so awaiting them directly blocks the
+    event loop and serializes every tool call. Each coroutine method is
+    instead run to completion on its own event loop in a worker thread, so
+    concurrent tool calls overlap their network I/O. Other attributes are
+    passed through unchanged.
+
+    The adapters create their client lazily on first use; that happens under
+    a lock so concurrent first calls authenticate only once.
+    """
+
+    def __init__(self, adapter: Any):
+        self._adapter = adapter
+        self._auth_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._adapter, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        def run(*args: Any, **kwargs: Any) -> Any:
+            # Create the coroutine inside the worker so it is never left unawaited
+            if name == "authenticate":
+                with self._auth_lock:
+                    return asyncio.run(attr(*args, **kwargs))
+            self._ensure_client()
+            return asyncio.run(attr(*args, **kwargs))
+
+        @functools.wraps(attr)
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            work = functools.partial(run, *args, **kwargs)
+            if _worker_call_wrapper is not None:
+                return await asyncio.to_thread(_worker_call_wrapper, work)
+            return await asyncio.to_thread(work)
+
+        return call
+
+    def _ensure_client(self) -> None:
+        if getattr(self._adapter, "client", True) is not None:
+            return
+        with self._auth_lock:
+            if self._adapter.client is None:
+                asyncio.run(self._adapter.authenticate())
+
+
+# Adapters reused across calls, keyed by platform name. Each entry stores the
+# config generation it was last checked against and the platform settings it
+# was built from, so only a reload that changed them rebuilds it.
+_adapter_cache: Dict[str, Tuple[int, Any, Any]] = {}
+
+
+# Seconds read-only results stay cached
+LIST_CACHE_TTL = 15
+DETAIL_CACHE_TTL = 30
+USER_CACHE_TTL = 300
+
+# Scope of cached listings that span projects; mutations on any project drop them
+CROSS_PROJECT_SCOPE = "*"
+
+# Response caches, one per adapter so they are dropped together with an
+# adapter that was rebuilt after a configuration change
+_response_caches: "weakref.WeakKeyDictionary[Any, TTLCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert call arguments into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _project_scope(project_id: Any) -> str:
+    """Normalize a project ID so equivalent spellings share a cache scope.
+
+    ``Group/Name``, ``group%2Fname`` and ``/group/name/`` all map to
+    ``group/name``; project paths are case-insensitive on both platforms.
+    """
+    return unquote(str(project_id)).strip().strip("/").lower()
+
+
+def _affected_by(entry_scope: Optional[str], scopes: set) -> bool:
+    """Return whether a cache entry may be stale after writes to ``scopes``.
+
+    Unscoped entries (user info, project listings) are never affected. A
+    numeric GitLab project ID and a ``group/name`` path can name the same
+    project, so when the forms differ the entry is dropped to be safe.
+    """
+    if entry_scope is None:
+        return False
+    if entry_scope == CROSS_PROJECT_SCOPE or entry_scope in scopes:
+        return True
+    return any(entry_scope.isdigit() != scope.isdigit() for scope in scopes)
+
+
+def _response_cache(adapter) -> TTLCache:
+    """Return the response cache belonging to ``adapter``."""
+    cache = _response_caches.get(adapter)
+    if cache is None:
+        cache = _response_caches[adapter] = TTLCache()
+    return cache
+
+
+def _cached_read(
+    ttl: float,
+    scope_arg: Optional[str] = "project_id",
+    scope: Optional[str] = None,
+    **options,
+):
+    """Cache a read-only service call per adapter for ``ttl`` seconds.
+
+    Identical concurrent calls share a single upstream request. Entries are
+    scoped by the ``scope_arg`` argument so mutations on one project only
+    drop that project's entries (and cross-project listings). Calls without
+    a project argument use the fixed ``scope`` instead.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            try:
+                adapter = PlatformService.get_adapter(arguments["platform_name"])
+                key = (func.__name__, _freeze(arguments))
+                hash(key)
+            except Exception:
+                # Unknown platform or unhashable filters: let the call report it
+                return await func(*args, **kwargs)
+
+            project_id = arguments.get(scope_arg) if scope_arg else None
+            return await _response_cache(adapter).get_or_load(
+                key,
+                ttl,
+                lambda: func(*args, **kwargs),
+                scope=_project_scope(project_id) if project_id is not None else scope,
+                **options,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidates_cache(func):
+    """Drop cached reads that a mutating service call may have made stale."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            arguments = signature.bind(*args, **kwargs).arguments
+            PlatformService.invalidate_cache(
+                arguments["platform_name"],
+                arguments.get("project_id"),
+                arguments.get("kwargs", {}).get("target_project_id"),
+            )
+
+    return wrapper
+
+
 class PlatformService:
     """Shared service for platform operations."""
 
     @staticmethod
     def get_adapter(platform_name: str):
-        """Get platform adapter based on configuration or environment variables."""
+        """Get a platform adapter, reusing the one from previous calls.
+
+        Reusing the adapter keeps its authenticated client and HTTP session
+        alive, so calls skip the auth round trip and the TCP/TLS handshake.
+        The adapter is rebuilt only when a successful config reload changed
+        this platform's settings; if building the new one fails, the old one
+        stays in use. Its methods run in worker threads (see
+        ``_ThreadedAdapter``).
+        """
+        config = get_config()
+        cached = _adapter_cache.get(platform_name)
+        if cached and cached[0] == config.generation:
+            return cached[2]
+
+        platform_config = config.get_platform(platform_name)
+        fingerprint = (
+            astuple(platform_config)
+            if platform_config
+            else (os.getenv("GIT_MCP_GITHUB_TOKEN"), os.getenv("GIT_MCP_GITLAB_TOKEN"))
+        )
+        if cached and cached[1] == fingerprint:
+            adapter = cached[2]
+        else:
+            adapter = _ThreadedAdapter(PlatformService._create_adapter(platform_name))
+            # The replaced adapter is not closed: calls running in worker
+            # threads may still be using it. It is released once they drop it.
+        _adapter_cache[platform_name] = (config.generation, fingerprint, adapter)
+        return adapter
+
+    @staticmethod
+    def close_adapters() -> None:
+        """Close the HTTP sessions of all cached adapters."""
+        for _, _, adapter in _adapter_cache.values():
+            adapter.close()
+        _adapter_cache.clear()
+
+    @staticmethod
+    def invalidate_cache(platform_name: str, *project_ids: Optional[str]) -> None:
+        """Drop cached reads for the given projects, or all of them if none given.
+
+        Cross-project listings (e.g. ``list_all_issues``) are dropped with any
+        project; user info and project listings are kept.
+        """
+        try:
+            cache = _response_caches.get(PlatformService.get_adapter(platform_name))
+        except Exception:
+            return
+        if cache is None:
+            return
+
+        scopes = {
+            _project_scope(project_id) for project_id in project_ids if project_id
+        }
+        if not scopes:
+            cache.invalidate()
+        else:
+            cache.invalidate_where(
+                lambda entry_scope: _affected_by(entry_scope, scopes)
+            )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached read for all platforms."""
+        for cache in list(_response_caches.values()):
+            cache.clear()
+
+    @staticmethod
+    def _create_adapter(platform_name: str):
+        """Create platform adapter based on configuration or environment variables."""
         config = get_config()
         platform_config = config.get_platform(platform_name)
 
@@ -120,31 +444,18 @@ class PlatformService:
 
         # Find configured platform by URL
         config = get_config()
-        platform_name = None
-
-        for name in config.list_platforms():
-            platform_config = config.get_platform(name)
+        for platform_name in config.list_platforms():
+            platform_config = config.get_platform(platform_name)
             if platform_config and host in platform_config.url:
-                platform_name = name
                 break
-
-        if not platform_name:
+        else:
             raise ValueError(f"No configured platform found for host: {host}")
 
-        platform_config = config.get_platform(platform_name)
-
-        if platform_config.type == "gitlab":
-            # GitLab URL format: /group/project/-/issues/123
-            match = re.search(r"/([^/]+(?:/[^/]+)*?)/-/issues/(\d+)", path)
-            if match:
-                project_path, issue_id = match.groups()
-                return platform_name, project_path, issue_id
-        elif platform_config.type == "github":
-            # GitHub URL format: /user/repo/issues/123
-            match = re.search(r"/([^/]+/[^/]+)/issues/(\d+)", path)
-            if match:
-                project_path, issue_id = match.groups()
-                return platform_name, project_path, issue_id
+        pattern = _ISSUE_PATH_PATTERNS.get(platform_config.type)
+        match = pattern.search(path) if pattern else None
+        if match:
+            project_path, issue_id = match.groups()
+            return platform_name, project_path, issue_id
 
         raise ValueError(f"Could not parse issue URL: {url}")
 
@@ -178,7 +489,7 @@ class PlatformService:
         return platform_name, project_id
 
     @staticmethod
-    async def list_platforms() -> List[Dict[str, str]]:
+    def list_platforms() -> List[Dict[str, str]]:
         """List all configured platforms."""
         config = get_config()
         platforms = config.list_platforms()
@@ -279,7 +590,7 @@ class PlatformService:
             raise Exception(f"Failed to list my merge requests: {str(e)}")
 
     @staticmethod
-    async def get_platform_config(platform_name: str) -> Dict[str, Any]:
+    def get_platform_config(platform_name: str) -> Dict[str, Any]:
         """Get configuration for a specific platform."""
         try:
             config = get_config()
@@ -309,6 +620,11 @@ class PlatformService:
             }
 
     @staticmethod
+    @_cached_read(
+        USER_CACHE_TTL,
+        scope_arg=None,
+        should_store=lambda result: result.get("success"),
+    )
     async def get_current_user_info(platform_name: str) -> Dict[str, Any]:
         """Get current user information from platform API."""
         try:
@@ -377,17 +693,15 @@ class PlatformService:
             }
 
     @staticmethod
+    @_cached_read(LIST_CACHE_TTL)
     async def list_projects(
         platform_name: str, limit: Optional[int] = 20, **filters
     ) -> List[Dict[str, Any]]:
         """List projects from a platform."""
         adapter = PlatformService.get_adapter(platform_name)
+        request = ListRequest.build(platform_name, limit=limit, **filters)
 
-        # Prepare filters
-        if limit:
-            filters["per_page"] = limit
-
-        projects = await adapter.list_projects(**filters)
+        projects = await adapter.list_projects(**request.adapter_filters())
 
         return [
             {
@@ -412,6 +726,7 @@ class PlatformService:
         ]
 
     @staticmethod
+    @_cached_read(DETAIL_CACHE_TTL)
     async def get_project_details(
         platform_name: str, project_id: str
     ) -> Dict[str, Any]:
@@ -447,6 +762,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def create_project(platform_name: str, name: str, **kwargs) -> Dict[str, Any]:
         """Create a new project."""
         adapter = PlatformService.get_adapter(platform_name)
@@ -464,6 +780,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def delete_project(platform_name: str, project_id: str) -> Dict[str, Any]:
         """Delete a project."""
         adapter = PlatformService.get_adapter(platform_name)
@@ -479,6 +796,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_cached_read(LIST_CACHE_TTL)
     async def list_issues(
         platform_name: str,
         project_id: str,
@@ -488,13 +806,9 @@ class PlatformService:
     ) -> List[Dict[str, Any]]:
         """List issues in a project."""
         adapter = PlatformService.get_adapter(platform_name)
+        request = ListRequest.build(platform_name, project_id, state, limit, **filters)
 
-        # Prepare filters
-        filters["state"] = state
-        if limit:
-            filters["per_page"] = limit
-
-        issues = await adapter.list_issues(project_id, **filters)
+        issues = await adapter.list_issues(project_id, **request.adapter_filters())
 
         return [
             {
@@ -519,6 +833,7 @@ class PlatformService:
         ]
 
     @staticmethod
+    @_cached_read(LIST_CACHE_TTL, scope_arg=None, scope=CROSS_PROJECT_SCOPE)
     async def list_all_issues(
         platform_name: str,
         state: str = "opened",
@@ -527,12 +842,9 @@ class PlatformService:
     ) -> List[Dict[str, Any]]:
         """List issues across all projects (global search)."""
         adapter = PlatformService.get_adapter(platform_name)
-        # Prepare filters
-        filters["state"] = state
-        if limit:
-            filters["per_page"] = limit
+        request = ListRequest.build(platform_name, state=state, limit=limit, **filters)
 
-        issues = await adapter.list_all_issues(**filters)
+        issues = await adapter.list_all_issues(**request.adapter_filters())
         return [
             {
                 "id": issue.id,
@@ -556,6 +868,7 @@ class PlatformService:
         ]
 
     @staticmethod
+    @_cached_read(DETAIL_CACHE_TTL)
     async def get_issue_details(
         platform_name: str, project_id: str, issue_id: str
     ) -> Dict[str, Any]:
@@ -597,6 +910,7 @@ class PlatformService:
         )
 
     @staticmethod
+    @_invalidates_cache
     async def create_issue(
         platform_name: str,
         project_id: str,
@@ -613,7 +927,8 @@ class PlatformService:
         if description:
             kwargs["description"] = description
         if labels:
-            kwargs["labels"] = ",".join(labels)
+            # Adapters encode the list the way their API expects
+            kwargs["labels"] = labels
         if assignee:
             kwargs["assignee_username"] = assignee
 
@@ -634,6 +949,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def update_issue(
         platform_name: str, project_id: str, issue_id: str, **kwargs
     ) -> Dict[str, Any]:
@@ -652,6 +968,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def close_issue(
         platform_name: str, project_id: str, issue_id: str
     ) -> Dict[str, Any]:
@@ -670,6 +987,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def create_issue_comment(
         platform_name: str, project_id: str, issue_id: str, body: str, **kwargs
     ) -> Dict[str, Any]:
@@ -688,6 +1006,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_cached_read(LIST_CACHE_TTL)
     async def list_merge_requests(
         platform_name: str,
         project_id: str,
@@ -697,13 +1016,9 @@ class PlatformService:
     ) -> List[Dict[str, Any]]:
         """List merge requests in a project."""
         adapter = PlatformService.get_adapter(platform_name)
+        request = ListRequest.build(platform_name, project_id, state, limit, **filters)
 
-        # Prepare filters
-        filters["state"] = state
-        if limit:
-            filters["per_page"] = limit
-
-        mrs = await adapter.list_merge_requests(project_id, **filters)
+        mrs = await adapter.list_merge_requests(project_id, **request.adapter_filters())
 
         return [
             {
@@ -729,6 +1044,7 @@ class PlatformService:
         ]
 
     @staticmethod
+    @_cached_read(DETAIL_CACHE_TTL)
     async def get_merge_request_details(
         platform_name: str, project_id: str, mr_id: str
     ) -> Dict[str, Any]:
@@ -763,6 +1079,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def create_merge_request(
         platform_name: str,
         project_id: str,
@@ -792,6 +1109,7 @@ class PlatformService:
 
     # Fork operations
     @staticmethod
+    @_invalidates_cache
     async def create_fork(
         platform_name: str, project_id: str, **kwargs
     ) -> Dict[str, Any]:
@@ -814,6 +1132,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_cached_read(DETAIL_CACHE_TTL)
     async def get_fork_info(platform_name: str, project_id: str) -> Dict[str, Any]:
         """Get fork information for a repository."""
         adapter = PlatformService.get_adapter(platform_name)
@@ -850,6 +1169,7 @@ class PlatformService:
         ]
 
     @staticmethod
+    @_cached_read(DETAIL_CACHE_TTL)
     async def get_merge_request_diff(
         platform_name: str, project_id: str, mr_id: str, **options
     ) -> Dict[str, Any]:
@@ -864,6 +1184,7 @@ class PlatformService:
         return diff_data
 
     @staticmethod
+    @_cached_read(DETAIL_CACHE_TTL)
     async def get_merge_request_commits(
         platform_name: str, project_id: str, mr_id: str, **filters
     ) -> Dict[str, Any]:
@@ -880,6 +1201,7 @@ class PlatformService:
         return commits_data
 
     @staticmethod
+    @_invalidates_cache
     async def close_merge_request(
         platform_name: str, project_id: str, mr_id: str, **kwargs
     ) -> Dict[str, Any]:
@@ -896,6 +1218,7 @@ class PlatformService:
         }
 
     @staticmethod
+    @_invalidates_cache
     async def update_merge_request(
         platform_name: str, project_id: str, mr_id: str, **kwargs
     ) -> Dict[str, Any]:
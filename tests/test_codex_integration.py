@@ -149,6 +149,23 @@ class TestCodexMCPServerConfiguration:
                     # Verify existing config was loaded
                     mock_tomllib.loads.assert_called_once()
 
+    def test_configure_up_to_date_config_is_not_rewritten(self):
+        """Test that an already configured file is left untouched."""
+        self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        self.config_file.write_text(
+            '[mcp_servers.git-mcp-server]\ncommand = "git-mcp-server"\n'
+            "args = []\n\n[mcp_servers.git-mcp-server.env]\n"
+        )
+        mtime = self.config_file.stat().st_mtime_ns
+
+        with patch("pathlib.Path.home") as mock_home:
+            mock_home.return_value = Path(self.temp_dir)
+
+            result = _configure_codex_mcp_server()
+
+        assert result is True
+        assert self.config_file.stat().st_mtime_ns == mtime
+
     def test_configure_toml_decode_error(self):
         """Test handling of TOML decode errors."""
         # Create malformed config file
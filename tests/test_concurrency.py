@@ -0,0 +1,288 @@
+"""Tests for per-platform concurrency limits."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from git_mcp.core import concurrency
+from git_mcp.core.concurrency import (
+    AdmissionController,
+    TokenBucket,
+    platform_controller,
+    platform_limits,
+    platform_slot,
+    rate_limit,
+    set_platform_limit,
+    set_platform_rate,
+)
+from git_mcp.core.exceptions import PlatformError
+from git_mcp.mcp_server import get_issues_bulk, list_issues_bulk
+
+
+class TestPlatformSlot:
+    """Test that platform slots bound concurrent calls."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_calls(self, monkeypatch):
+        """Test that no more than the configured number of calls run at once."""
+        monkeypatch.setenv("GIT_MCP_MAX_CONCURRENCY", "2")
+        running = peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with platform_slot("limited"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_platforms_are_limited_independently(self, monkeypatch):
+        """Test that one platform's calls do not block another's."""
+        monkeypatch.setenv("GIT_MCP_MAX_CONCURRENCY", "1")
+
+        async with platform_slot("first"):
+            await asyncio.wait_for(_enter(platform_slot("second")), timeout=1)
+
+
+async def _enter(slot):
+    async with slot:
+        pass
+
+
+class TestAdmissionController:
+    """Test resizing the admission controller at runtime."""
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_admits_waiters(self):
+        """Test that raising the limit wakes calls waiting for a slot."""
+        controller = AdmissionController(1)
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await controller.set_limit(2)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert controller.active == 2
+
+    @pytest.mark.asyncio
+    async def test_lowering_limit_holds_new_calls(self):
+        """Test that lowering the limit blocks new calls until slots free up."""
+        controller = AdmissionController(2)
+        await controller.acquire()
+        await controller.acquire()
+        await controller.set_limit(1)
+        waiter = asyncio.create_task(controller.acquire())
+
+        await controller.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await controller.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.active == 1
+
+    @pytest.mark.asyncio
+    async def test_platform_limit_override(self, monkeypatch):
+        """Test that a runtime override replaces the environment limit."""
+        monkeypatch.setenv("GIT_MCP_MAX_CONCURRENCY", "4")
+
+        assert await set_platform_limit("tuned", 2) == 2
+        assert platform_controller("tuned").limit == 2
+        assert await set_platform_limit("tuned", None) == 4
+
+    @pytest.mark.asyncio
+    async def test_platform_config_limit(self, monkeypatch):
+        """Test that a platform's max_concurrency overrides the environment."""
+        monkeypatch.setenv("GIT_MCP_MAX_CONCURRENCY", "4")
+        config = Mock()
+        config.get_platform.return_value = Mock(max_concurrency=3)
+
+        with patch("git_mcp.core.concurrency.get_config", return_value=config):
+            limits = platform_limits("configured")
+
+        assert limits["concurrency"] == {"limit": 3, "active": 0}
+
+
+class TestTokenBucket:
+    """Test rate limiting of platform calls."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self, monkeypatch):
+        """Test that calls beyond the burst wait for the bucket to refill."""
+        clock = [0.0]
+        monkeypatch.setattr("git_mcp.core.concurrency.time.monotonic", lambda: clock[0])
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        monkeypatch.setattr("git_mcp.core.concurrency.asyncio.sleep", fake_sleep)
+        bucket = TokenBucket(60)
+
+        for _ in range(61):
+            await bucket.acquire()
+
+        assert sleeps == [pytest.approx(1.0)]
+
+    def test_rate_limit_is_off_by_default(self, monkeypatch):
+        """Test that tool calls are not rate limited unless configured."""
+        monkeypatch.delenv("GIT_MCP_RATE_LIMIT", raising=False)
+
+        assert rate_limit() == 0
+
+    def test_platform_rate_override(self, monkeypatch):
+        """Test that a runtime rate override replaces the environment rate."""
+        monkeypatch.setenv("GIT_MCP_RATE_LIMIT", "30")
+
+        assert set_platform_rate("tuned", 0) == 0
+        assert set_platform_rate("tuned", None) == 30
+
+
+class _Throttled(Exception):
+    """Client library error carrying an HTTP status and headers."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers or {}
+
+
+async def _call(platform, error=None):
+    async with platform_slot(platform):
+        if error is not None:
+            try:
+                raise error
+            except _Throttled as e:
+                # Adapters wrap client errors; the status is found via the chain
+                raise PlatformError(str(e), platform) from e
+
+
+class TestAdaptiveLimit:
+    """Test AIMD adjustment of the concurrency limit."""
+
+    def teardown_method(self):
+        """Drop adaptive state left by the test."""
+        concurrency._adaptive_limits.clear()
+        concurrency._blocked_until.clear()
+
+    @pytest.mark.asyncio
+    async def test_throttling_halves_limit_and_success_recovers(self, monkeypatch):
+        """Test that a 429 halves the limit and successes grow it back."""
+        monkeypatch.setenv("GIT_MCP_MAX_CONCURRENCY", "8")
+        monkeypatch.setenv("GIT_MCP_RATE_LIMIT", "0")
+
+        with pytest.raises(PlatformError):
+            await _call("aimd", _Throttled(429))
+        assert platform_controller("aimd").limit == 4
+
+        for _ in range(4):
+            await _call("aimd")
+        assert platform_controller("aimd").limit == 6
+
+        for _ in range(4):
+            await _call("aimd")
+        assert platform_controller("aimd").limit == 8
+        assert "aimd" not in concurrency._adaptive_limits
+
+    @pytest.mark.asyncio
+    async def test_other_errors_keep_limit(self, monkeypatch):
+        """Test that ordinary failures do not shrink the limit."""
+        monkeypatch.setenv("GIT_MCP_MAX_CONCURRENCY", "8")
+        monkeypatch.setenv("GIT_MCP_RATE_LIMIT", "0")
+
+        with pytest.raises(PlatformError):
+            await _call("steady", _Throttled(404))
+
+        assert platform_controller("steady").limit == 8
+
+    @pytest.mark.asyncio
+    async def test_retry_after_delays_next_call(self, monkeypatch):
+        """Test that Retry-After holds back the platform's next call."""
+        monkeypatch.setenv("GIT_MCP_RATE_LIMIT", "0")
+        clock = [100.0]
+        monkeypatch.setattr("git_mcp.core.concurrency.time.monotonic", lambda: clock[0])
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        monkeypatch.setattr("git_mcp.core.concurrency.asyncio.sleep", fake_sleep)
+
+        with pytest.raises(PlatformError):
+            await _call("blocked", _Throttled(403, {"Retry-After": "30"}))
+        assert platform_limits("blocked")["backoff"]["retry_in"] == 30
+        await _call("blocked")
+
+        assert sleeps == [pytest.approx(30)]
+
+
+class TestBulkTools:
+    """Test tools that fan out several platform calls."""
+
+    @pytest.mark.asyncio
+    async def test_get_issues_bulk_keeps_order_and_errors(self):
+        """Test that one failing issue does not abort the batch."""
+
+        async def details(platform, project_id, issue_id):
+            if issue_id == "2":
+                raise ValueError("Issue 2 not found")
+            return {"id": issue_id}
+
+        with patch(
+            "git_mcp.mcp_server.PlatformService.get_issue_details",
+            AsyncMock(side_effect=details),
+        ):
+            result = await get_issues_bulk(
+                "github",
+                [
+                    {"project_id": "owner/repo", "issue_id": "1"},
+                    {"project_id": "owner/repo", "issue_id": "2"},
+                    {"project_id": "owner/repo", "issue_id": "3"},
+                ],
+            )
+
+        assert result == [{"id": "1"}, {"error": "Issue 2 not found"}, {"id": "3"}]
+
+    @pytest.mark.asyncio
+    async def test_get_issues_bulk_reports_malformed_items(self):
+        """Test that items missing an ID get an error entry of their own."""
+        with patch(
+            "git_mcp.mcp_server.PlatformService.get_issue_details",
+            AsyncMock(side_effect=lambda p, project_id, issue_id: {"id": issue_id}),
+        ):
+            result = await get_issues_bulk(
+                "github",
+                [
+                    {"project_id": "owner/repo"},
+                    {"project_id": "owner/repo", "issue_id": "2"},
+                    {},
+                ],
+            )
+
+        assert result == [
+            {"error": "Item 0 is missing issue_id"},
+            {"id": "2"},
+            {"error": "Item 2 is missing project_id, issue_id"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_issues_bulk_maps_projects(self):
+        """Test that issues are returned per project."""
+        mock_list = AsyncMock(
+            side_effect=lambda p, project_id, state, limit: [project_id]
+        )
+        with patch("git_mcp.mcp_server.PlatformService.list_issues", mock_list):
+            result = await list_issues_bulk("github", ["a/b", "c/d"], "closed", 5)
+
+        assert result == {"a/b": ["a/b"], "c/d": ["c/d"]}
+        mock_list.assert_any_await("github", "a/b", "closed", 5)
@@ -0,0 +1,74 @@
+"""Tests for configuration loading."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from git_mcp.core.config import GitMCPConfig
+
+VALID_CONFIG = """platforms:
+  gh:
+    type: github
+    url: https://github.com
+defaults:
+  timeout: 45
+"""
+
+
+class TestConfigReload:
+    """Test that reloads never leave a partial configuration behind."""
+
+    def setup_method(self):
+        """Create a config directory with a valid config file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_dir = Path(self.temp_dir.name)
+        self.config_file = self.config_dir / "config.yaml"
+        self.config_file.write_text(VALID_CONFIG)
+        with patch("git_mcp.core.config.keyring.get_password", return_value=None):
+            self.config = GitMCPConfig(self.config_dir)
+
+    def teardown_method(self):
+        """Remove the config directory."""
+        self.temp_dir.cleanup()
+
+    def _rewrite(self, content):
+        self.config_file.write_text(content)
+        # Make sure the mtime differs even on coarse-grained filesystems
+        stat = self.config_file.stat()
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_invalid_file_keeps_last_good_config(self):
+        """Test that a broken file is logged and the old config kept."""
+        self._rewrite("platforms: [unclosed")
+
+        assert self.config.reload_if_changed() is False
+        assert self.config.list_platforms() == ["gh"]
+        assert self.config.defaults.timeout == 45
+        # The broken version is not parsed again on every call
+        with patch.object(GitMCPConfig, "load") as mock_load:
+            assert self.config.reload_if_changed() is False
+        mock_load.assert_not_called()
+
+    def test_fixed_file_is_picked_up(self):
+        """Test that a corrected file is loaded after a failed one."""
+        self._rewrite("platforms: [unclosed")
+        self.config.reload_if_changed()
+
+        self._rewrite(VALID_CONFIG.replace("gh:", "other:"))
+        with patch("git_mcp.core.config.keyring.get_password", return_value=None):
+            assert self.config.reload_if_changed() is True
+
+        assert self.config.list_platforms() == ["other"]
+
+    def test_explicit_reload_raises_and_keeps_config(self):
+        """Test that reload() reports parse errors without clearing state."""
+        self._rewrite("defaults: {timeout: -1}")
+
+        with pytest.raises(ValueError, match="Failed to load configuration"):
+            self.config.reload()
+
+        assert self.config.list_platforms() == ["gh"]
+        assert self.config.defaults.timeout == 45
@@ -0,0 +1,23 @@
+"""Tests for GitHub adapter filter handling."""
+
+from git_mcp.platforms.github import GitHubAdapter
+
+
+class TestIssueFilters:
+    """Test normalization of issue filters to GitHub's format."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.adapter = GitHubAdapter("https://github.com", "mock-token", "test-user")
+
+    def test_comma_separated_labels_are_split(self):
+        """Test that a labels string becomes one entry per label."""
+        filters = self.adapter._normalize_issue_filters({"labels": "bug, ui ,,docs"})
+
+        assert filters["labels"] == ["bug", "ui", "docs"]
+
+    def test_label_list_is_passed_through(self):
+        """Test that a labels list is left as it is."""
+        filters = self.adapter._normalize_issue_filters({"labels": ["bug", "ui"]})
+
+        assert filters["labels"] == ["bug", "ui"]
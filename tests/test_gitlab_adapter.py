@@ -0,0 +1,105 @@
+"""Tests for GitLab adapter HTTP behaviour."""
+
+import io
+
+import requests
+from requests.adapters import HTTPAdapter
+from unittest.mock import patch
+
+from git_mcp.platforms.gitlab import ConditionalRequestAdapter
+
+
+def _response(status_code, body=b"", etag=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.raw = io.BytesIO(body)
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+def _get(url="https://gitlab.example.com/api/v4/projects"):
+    return requests.Request("GET", url).prepare()
+
+
+class TestConditionalRequestAdapter:
+    """Test ETag revalidation of repeated GET requests."""
+
+    def test_not_modified_returns_cached_body(self):
+        """Test that a 304 is answered with the stored response."""
+        adapter = ConditionalRequestAdapter()
+        sent = []
+
+        def send(self, request, **kwargs):
+            sent.append(dict(request.headers))
+            if len(sent) == 1:
+                return _response(200, b"[1, 2]", etag='W/"abc"')
+            return _response(304)
+
+        with patch.object(HTTPAdapter, "send", send):
+            adapter.send(_get())
+            second = adapter.send(_get())
+
+        assert second.status_code == 200
+        assert second.json() == [1, 2]
+        assert "If-None-Match" not in sent[0]
+        assert sent[1]["If-None-Match"] == 'W/"abc"'
+
+    def test_non_get_requests_bypass_cache(self):
+        """Test that only GET requests are revalidated."""
+        adapter = ConditionalRequestAdapter()
+        request = requests.Request(
+            "POST", "https://gitlab.example.com/api/v4/projects"
+        ).prepare()
+
+        with patch.object(
+            HTTPAdapter, "send", return_value=_response(201, b"{}", etag='"x"')
+        ):
+            adapter.send(request)
+
+        assert len(adapter._responses) == 0
+
+    def test_cache_is_bounded(self):
+        """Test that the oldest responses are dropped beyond the cache size."""
+        adapter = ConditionalRequestAdapter(cache_size=2)
+
+        with patch.object(
+            HTTPAdapter, "send", side_effect=lambda *a, **k: _response(200, etag='"e"')
+        ):
+            for page in range(3):
+                adapter.send(_get(f"https://gitlab.example.com/api/v4/p?page={page}"))
+
+        assert list(adapter._responses) == [
+            "https://gitlab.example.com/api/v4/p?page=1",
+            "https://gitlab.example.com/api/v4/p?page=2",
+        ]
+
+    def test_cache_is_bounded_by_bytes(self):
+        """Test that the oldest responses are dropped beyond the byte budget."""
+        adapter = ConditionalRequestAdapter(cache_bytes=10)
+
+        with patch.object(
+            HTTPAdapter,
+            "send",
+            side_effect=lambda *a, **k: _response(200, b"x" * 4, etag='"e"'),
+        ):
+            for page in range(3):
+                adapter.send(_get(f"https://gitlab.example.com/api/v4/p?page={page}"))
+
+        assert list(adapter._responses) == [
+            "https://gitlab.example.com/api/v4/p?page=1",
+            "https://gitlab.example.com/api/v4/p?page=2",
+        ]
+        assert adapter._stored_bytes == 8
+
+    def test_large_bodies_are_not_kept(self):
+        """Test that responses over the body limit are not cached."""
+        adapter = ConditionalRequestAdapter(max_body_bytes=4)
+
+        with patch.object(
+            HTTPAdapter, "send", return_value=_response(200, b"x" * 5, etag='"e"')
+        ):
+            adapter.send(_get())
+
+        assert len(adapter._responses) == 0
@@ -0,0 +1,48 @@
+"""Tests for JSON settings file helpers."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from git_mcp.mcp_server import _write_json_file
+
+
+class TestWriteJsonFile:
+    """Test atomic writes of JSON settings files."""
+
+    def setup_method(self):
+        """Create a scratch directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def teardown_method(self):
+        """Remove the scratch directory."""
+        self.temp_dir.cleanup()
+
+    def test_writes_json(self):
+        """Test that the data is written and no temporary file is left behind."""
+        path = self.root / "settings.json"
+
+        _write_json_file(path, {"a": 1})
+
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert os.listdir(self.root) == ["settings.json"]
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+    def test_symlinked_file_is_written_through(self):
+        """Test that a symlinked settings file keeps its link and gets the update."""
+        dotfiles = self.root / "dotfiles"
+        dotfiles.mkdir()
+        target = dotfiles / "settings.json"
+        target.write_text('{"old": true}')
+        link = self.root / "settings.json"
+        link.symlink_to(target)
+
+        _write_json_file(link, {"new": True})
+
+        assert link.is_symlink()
+        assert json.loads(target.read_text()) == {"new": True}
+        assert os.listdir(dotfiles) == ["settings.json"]
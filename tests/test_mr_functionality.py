@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
+from github import GithubException
 
 from git_mcp.platforms.github import GitHubAdapter
 from git_mcp.platforms.gitlab import GitLabAdapter
@@ -130,6 +131,21 @@ class TestGitHubAdapterMROperations:
         assert result.state == ResourceState.OPENED
         assert result.author == "test-author"
 
+    @pytest.mark.asyncio
+    async def test_get_merge_request_skips_repository_fetch(self):
+        """Test that reading a PR does not fetch the repository first."""
+        # Arrange
+        self.mock_client.get_repo.return_value.get_pull.side_effect = GithubException(
+            404, "Not Found"
+        )
+
+        # Act
+        result = await self.adapter.get_merge_request("owner/repo", "123")
+
+        # Assert
+        assert result is None
+        self.mock_client.get_repo.assert_called_once_with("owner/repo", lazy=True)
+
     @pytest.mark.asyncio
     async def test_list_merge_requests_empty_result(self):
         """Test listing PRs when repository has no PRs."""
@@ -293,6 +309,66 @@ class TestGitLabAdapterMROperations:
 
         assert "404" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_list_merge_requests_stops_at_limit(self):
+        """Test that listing fetches lazily and stops at the requested limit."""
+        # Arrange
+        mock_project = Mock()
+        consumed = []
+
+        def mr_pages(**kwargs):
+            for iid in range(1, 100):
+                consumed.append(iid)
+                mock_mr = Mock()
+                mock_mr.iid = iid
+                mock_mr.state = "opened"
+                mock_mr.author = None
+                mock_mr.assignee = None
+                mock_mr.created_at = None
+                mock_mr.updated_at = None
+                yield mock_mr
+
+        self.adapter.client.projects.get.return_value = mock_project
+        mock_project.mergerequests.list.side_effect = mr_pages
+
+        # Act
+        result = await self.adapter.list_merge_requests(
+            "group/project", state="opened", per_page=3
+        )
+
+        # Assert
+        assert [mr.id for mr in result] == ["1", "2", "3"]
+        assert consumed == [1, 2, 3]
+        mock_project.mergerequests.list.assert_called_once_with(
+            iterator=True, state="opened", per_page=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_merge_request_diff_is_bounded(self):
+        """Test that large diffs are cut off and marked as truncated."""
+        # Arrange
+        mock_mr = Mock(spec=["changes"])
+        mock_mr.changes.return_value = {
+            "changes": [
+                {"new_path": f"file{i}.py", "diff": "+" * 40, "new_file": False}
+                for i in range(5)
+            ]
+        }
+        self.adapter.client.projects.get.return_value.mergerequests.get.return_value = (
+            mock_mr
+        )
+
+        # Act
+        result = await self.adapter.get_merge_request_diff(
+            "group/project", "1", max_files=4, max_bytes=100
+        )
+
+        # Assert
+        assert [f["path"] for f in result["files"]] == [f"file{i}.py" for i in range(4)]
+        assert ["diff" in f for f in result["files"]] == [True, True, False, False]
+        assert result["total_changes"]["files_changed"] == 5
+        assert result["truncated"] is True
+
 
 class TestPlatformServiceMRIntegration:
     """Test PlatformService MR operations integration."""
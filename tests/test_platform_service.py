@@ -0,0 +1,375 @@
+"""Tests for shared PlatformService behaviour."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from git_mcp.core.config import PlatformConfig
+from git_mcp.services.platform_service import (
+    PlatformService,
+    _ThreadedAdapter,
+    set_worker_call_wrapper,
+)
+
+
+class TestAdapterReuse:
+    """Test that adapters are reused across calls."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        PlatformService.close_adapters()
+        self.config = Mock()
+        self.platform_config = PlatformConfig(
+            name="github", type="github", url="https://github.com", token="t1"
+        )
+        self.config.generation = 1
+        self.config.get_platform.return_value = self.platform_config
+
+    def teardown_method(self):
+        """Drop cached adapters."""
+        PlatformService.close_adapters()
+
+    def test_adapter_is_reused(self):
+        """Test that repeated calls return the same adapter."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            first = PlatformService.get_adapter("github")
+            second = PlatformService.get_adapter("github")
+
+        assert first is second
+
+    def test_adapter_rebuilt_after_config_change(self):
+        """Test that a changed token produces a fresh adapter."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            first = PlatformService.get_adapter("github")
+            self.platform_config.token = "t2"
+            self.config.generation = 2
+            second = PlatformService.get_adapter("github")
+
+        assert first is not second
+        assert second.token == "t2"
+
+    def test_replaced_adapter_is_not_closed(self):
+        """Test that a rebuild leaves the old adapter usable for in-flight calls."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            first = PlatformService.get_adapter("github")
+            first._adapter.client = Mock()
+            self.platform_config.token = "t2"
+            self.config.generation = 2
+            PlatformService.get_adapter("github")
+
+        assert first._adapter.client is not None
+
+    def test_unchanged_platform_survives_reload(self):
+        """Test that a reload that leaves the platform alone keeps the adapter."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            first = PlatformService.get_adapter("github")
+            self.config.generation = 2
+            second = PlatformService.get_adapter("github")
+
+        assert first is second
+
+    def test_failed_rebuild_keeps_adapter(self):
+        """Test that a platform missing after a reload does not evict the adapter."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            first = PlatformService.get_adapter("github")
+            self.config.generation = 2
+            self.config.get_platform.return_value = None
+            with patch.dict("os.environ", {"GIT_MCP_GITHUB_TOKEN": ""}):
+                with pytest.raises(ValueError):
+                    PlatformService.get_adapter("github")
+            self.config.get_platform.return_value = self.platform_config
+            self.config.generation = 3
+            second = PlatformService.get_adapter("github")
+
+        assert first is second
+
+
+class TestThreadedAdapter:
+    """Test that adapter calls run off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_calls_overlap(self):
+        """Test that blocking adapter methods do not serialize on the loop."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BlockingAdapter:
+            platform_name = "github"
+
+            async def get_issue(self, project_id, issue_id):
+                # Both calls must be running at once to get past the barrier
+                barrier.wait()
+                time.sleep(0.01)
+                return issue_id
+
+        adapter = _ThreadedAdapter(BlockingAdapter())
+        results = await asyncio.gather(
+            adapter.get_issue("p", "1"), adapter.get_issue("p", "2")
+        )
+
+        assert results == ["1", "2"]
+        assert adapter.platform_name == "github"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_authenticate_once(self):
+        """Test that the lazy client is created once under concurrency."""
+        calls = []
+
+        class LazyAdapter:
+            client = None
+
+            async def authenticate(self):
+                calls.append(1)
+                time.sleep(0.01)
+                self.client = object()
+                return True
+
+            async def get_issue(self, project_id, issue_id):
+                if not self.client:
+                    await self.authenticate()
+                return issue_id
+
+        adapter = _ThreadedAdapter(LazyAdapter())
+        results = await asyncio.gather(
+            *(adapter.get_issue("p", str(i)) for i in range(5))
+        )
+
+        assert results == ["0", "1", "2", "3", "4"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_call_wrapper_runs_in_worker(self):
+        """Test that the call wrapper runs in the thread doing the work."""
+        threads = []
+
+        class Adapter:
+            async def get_issue(self, project_id, issue_id):
+                threads.append(threading.get_ident())
+                return issue_id
+
+        def wrapper(call):
+            threads.append(threading.get_ident())
+            return call()
+
+        set_worker_call_wrapper(wrapper)
+        try:
+            result = await _ThreadedAdapter(Adapter()).get_issue("p", "1")
+        finally:
+            set_worker_call_wrapper(None)
+
+        assert result == "1"
+        assert len(threads) == 2
+        assert threads[0] == threads[1] != threading.get_ident()
+
+
+class TestParseIssueUrl:
+    """Test issue URL parsing."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        platforms = {
+            "gl": PlatformConfig(name="gl", type="gitlab", url="https://gitlab.com"),
+            "gh": PlatformConfig(name="gh", type="github", url="https://github.com"),
+        }
+        self.config = Mock()
+        self.config.list_platforms.return_value = list(platforms)
+        self.config.get_platform.side_effect = platforms.get
+
+    def test_parse_gitlab_nested_group_url(self):
+        """Test GitLab URLs with nested groups."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            result = PlatformService.parse_issue_url(
+                "https://gitlab.com/group/sub/project/-/issues/123"
+            )
+
+        assert result == ("gl", "group/sub/project", "123")
+
+    def test_parse_github_url(self):
+        """Test GitHub issue URLs."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            result = PlatformService.parse_issue_url(
+                "https://github.com/user/repo/issues/456"
+            )
+
+        assert result == ("gh", "user/repo", "456")
+
+    def test_parse_invalid_url(self):
+        """Test that unparseable URLs raise ValueError."""
+        with patch(
+            "git_mcp.services.platform_service.get_config", return_value=self.config
+        ):
+            with pytest.raises(ValueError, match="Could not parse issue URL"):
+                PlatformService.parse_issue_url("https://github.com/user/repo")
+
+
+class TestResponseCache:
+    """Test caching of read-only service calls."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.adapter = Mock()
+        self.adapter.get_issue = AsyncMock(return_value=None)
+        self.adapter.list_issues = AsyncMock(return_value=[])
+        self.adapter.get_merge_request_diff = AsyncMock(return_value={"files": []})
+        self.adapter.close_issue = AsyncMock(
+            return_value=Mock(id="1", title="t", state=None, url="u")
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self):
+        """Test that identical list calls reach the adapter once."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            await PlatformService.list_issues("github", "owner/repo")
+            await PlatformService.list_issues("github", "owner/repo")
+            await PlatformService.list_issues("github", "owner/repo", "closed")
+
+        assert self.adapter.list_issues.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_merge_request_diff_is_cached(self):
+        """Test that diffs are cached per set of options."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            first = await PlatformService.get_merge_request_diff("github", "o/r", "1")
+            await PlatformService.get_merge_request_diff("github", "o/r", "1")
+            await PlatformService.get_merge_request_diff(
+                "github", "o/r", "1", include_diff=False
+            )
+
+        assert first["mr_id"] == "1"
+        assert self.adapter.get_merge_request_diff.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_are_coalesced(self):
+        """Test that concurrent identical calls share one upstream request."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            await asyncio.gather(
+                *(PlatformService.list_issues("github", "owner/repo") for _ in range(5))
+            )
+
+        assert self.adapter.list_issues.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_project(self):
+        """Test that mutating a project drops its cached reads."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            await PlatformService.list_issues("github", "owner/repo")
+            await PlatformService.close_issue("github", "owner/repo", "1")
+            await PlatformService.list_issues("github", "owner/repo")
+
+        assert self.adapter.list_issues.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_in_flight_during_write_is_not_cached(self):
+        """Test that a read overlapping a write neither is stored nor joined."""
+        release = asyncio.Event()
+
+        async def slow_list(*args, **kwargs):
+            if self.adapter.list_issues.await_count == 1:
+                await release.wait()
+            return []
+
+        self.adapter.list_issues = AsyncMock(side_effect=slow_list)
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            slow_read = asyncio.create_task(
+                PlatformService.list_issues("github", "owner/repo")
+            )
+            await asyncio.sleep(0)
+            await PlatformService.close_issue("github", "owner/repo", "1")
+            # Started after the write, so it must not join the older load
+            fresh_read = asyncio.create_task(
+                PlatformService.list_issues("github", "owner/repo")
+            )
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(slow_read, fresh_read)
+            assert self.adapter.list_issues.await_count == 2
+
+            # The fresh read was stored, the pre-write one was not
+            await PlatformService.list_issues("github", "owner/repo")
+
+        assert self.adapter.list_issues.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_finishing_after_write_is_not_stored(self):
+        """Test that a value loaded before a write is not served afterwards."""
+        release = asyncio.Event()
+
+        async def slow_list(*args, **kwargs):
+            if self.adapter.list_issues.await_count == 1:
+                await release.wait()
+            return []
+
+        self.adapter.list_issues = AsyncMock(side_effect=slow_list)
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            slow_read = asyncio.create_task(
+                PlatformService.list_issues("github", "owner/repo")
+            )
+            await asyncio.sleep(0)
+            await PlatformService.close_issue("github", "owner/repo", "1")
+            release.set()
+            await slow_read
+            await PlatformService.list_issues("github", "owner/repo")
+
+        assert self.adapter.list_issues.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mutation_keeps_unrelated_reads(self):
+        """Test that a mutation leaves other projects and user info cached."""
+        self.adapter.get_current_user = AsyncMock(return_value={"username": "me"})
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            await PlatformService.get_current_user_info("github")
+            await PlatformService.list_issues("github", "owner/other")
+            await PlatformService.close_issue("github", "owner/repo", "1")
+            await PlatformService.get_current_user_info("github")
+            await PlatformService.list_issues("github", "owner/other")
+
+        assert self.adapter.get_current_user.await_count == 1
+        assert self.adapter.list_issues.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mutation_matches_other_project_id_forms(self):
+        """Test that path spellings and numeric IDs of a project are invalidated."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            await PlatformService.list_issues("gitlab", "Group/Repo")
+            await PlatformService.list_issues("gitlab", "42")
+            await PlatformService.close_issue("gitlab", "group%2Frepo", "1")
+            await PlatformService.list_issues("gitlab", "Group/Repo")
+            await PlatformService.list_issues("gitlab", "42")
+
+        assert self.adapter.list_issues.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test that failed reads are retried on the next call."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            for _ in range(2):
+                with pytest.raises(ValueError, match="not found"):
+                    await PlatformService.get_issue_details("github", "owner/repo", "9")
+
+        assert self.adapter.get_issue.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_drops_all_reads(self):
+        """Test that clearing the cache forces fresh reads."""
+        with patch.object(PlatformService, "get_adapter", return_value=self.adapter):
+            await PlatformService.list_issues("github", "owner/repo")
+            PlatformService.clear_cache()
+            await PlatformService.list_issues("github", "owner/repo")
+
+        assert self.adapter.list_issues.await_count == 2
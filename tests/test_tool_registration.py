@@ -0,0 +1,185 @@
+"""Tests for MCP tool registration."""
+
+import inspect
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from git_mcp import mcp_server
+from git_mcp.core.exceptions import NetworkError
+from git_mcp.mcp_server import PASSTHROUGH_TOOLS, mcp
+
+
+class TestToolRegistration:
+    """Test that every MCP tool is registered exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_tool_names_are_unique(self):
+        """Test that no tool name is registered twice."""
+        names = [tool.name for tool in await mcp.list_tools()]
+
+        assert len(names) == len(set(names))
+
+    def test_passthrough_table_has_no_duplicates(self):
+        """Test that the passthrough table does not shadow explicit tools."""
+        names = [name for name, _ in PASSTHROUGH_TOOLS]
+
+        assert len(names) == len(set(names))
+        for explicit in (
+            "list_my_issues",
+            "get_issue_by_url",
+            "update_issue",
+            "create_merge_request",
+        ):
+            assert explicit not in names
+
+    def test_passthrough_tools_expose_platform_argument(self):
+        """Test that passthrough tools keep the public ``platform`` argument."""
+        for name, _ in PASSTHROUGH_TOOLS:
+            params = inspect.signature(getattr(mcp_server, name)).parameters
+
+            assert "platform_name" not in params
+
+
+class TestIssueKwargs:
+    """Test mapping of tool arguments onto adapter keyword arguments."""
+
+    def test_none_fields_are_skipped(self):
+        """Test that only provided fields are passed on."""
+        result = mcp_server._normalize_issue_kwargs(
+            {}, title=None, labels=["bug", "ui"], assignee="me", state="close"
+        )
+
+        assert result == {
+            "labels": ["bug", "ui"],
+            "assignee_username": "me",
+            "state_event": "close",
+        }
+
+    def test_empty_strings_are_kept(self):
+        """Test that an empty description can clear the field."""
+        result = mcp_server._normalize_issue_kwargs({}, description="", labels=[])
+
+        assert result == {"description": ""}
+
+    def test_empty_identifiers_are_skipped(self):
+        """Test that empty assignee, state and target project are not sent."""
+        result = mcp_server._normalize_issue_kwargs(
+            {}, title="", assignee="", state="", target_project_id=""
+        )
+
+        assert result == {"title": ""}
+
+    @pytest.mark.asyncio
+    async def test_update_issue_with_empty_state(self):
+        """Test that update_issue(state="") sends no state_event."""
+        with patch(
+            "git_mcp.mcp_server.PlatformService.update_issue",
+            AsyncMock(return_value={}),
+        ) as mock_update:
+            await mcp_server.update_issue("gitlab", "g/p", "1", title="t", state="")
+
+        mock_update.assert_awaited_once_with("gitlab", "g/p", "1", title="t")
+
+    @pytest.mark.asyncio
+    async def test_create_merge_request_with_empty_assignee(self):
+        """Test that create_merge_request(assignee="") sends no assignee."""
+        with patch(
+            "git_mcp.mcp_server.PlatformService.create_merge_request",
+            AsyncMock(return_value={}),
+        ) as mock_create:
+            await mcp_server.create_merge_request(
+                "github", "o/r", "Title", "feature", "main", assignee=""
+            )
+
+        assert "assignee_username" not in mock_create.await_args.kwargs
+
+
+class TestListMyIssues:
+    """Test error handling in list_my_issues."""
+
+    @pytest.mark.asyncio
+    async def test_missing_username_returns_error(self):
+        """Test that a missing username is reported as a structured error."""
+        config = Mock()
+        config.get_platform.return_value = Mock(username=None)
+        with patch("git_mcp.mcp_server.get_config", return_value=config):
+            result = await mcp_server.list_my_issues("github")
+
+        assert "No username configured" in result[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_platform_errors_propagate(self):
+        """Test that platform failures are not wrapped in a generic error."""
+        config = Mock()
+        config.get_platform.return_value = Mock(username="me")
+        with (
+            patch("git_mcp.mcp_server.get_config", return_value=config),
+            patch(
+                "git_mcp.mcp_server.PlatformService.list_all_issues",
+                AsyncMock(side_effect=NetworkError("timed out")),
+            ),
+        ):
+            with pytest.raises(NetworkError, match="timed out"):
+                await mcp_server.list_my_issues("github")
+
+
+class TestConfigTools:
+    """Test tools that only read local configuration."""
+
+    @pytest.mark.asyncio
+    async def test_config_tools_run_synchronously(self):
+        """Test that config-only tools are plain functions FastMCP can call."""
+        assert not inspect.iscoroutinefunction(mcp_server.list_platforms)
+
+        result = await mcp.call_tool("get_platform_config", {"platform": "missing"})
+
+        assert '"found": false' in result[0][0].text
+
+
+class TestCreateMergeRequestKwargs:
+    """Test handling of extra keyword arguments in create_merge_request."""
+
+    @pytest.mark.asyncio
+    async def test_nested_json_kwargs_are_merged(self):
+        """Test that a JSON ``kwargs`` string is parsed into keyword arguments."""
+        mock_create = AsyncMock(return_value={"id": "1"})
+        with patch(
+            "git_mcp.mcp_server.PlatformService.create_merge_request", mock_create
+        ):
+            await mcp_server.create_merge_request(
+                "gitlab",
+                "123",
+                "Fix bug",
+                "feature",
+                kwargs='{"description": "Details", "draft": true}',
+            )
+
+        mock_create.assert_awaited_once_with(
+            "gitlab",
+            "123",
+            "Fix bug",
+            "feature",
+            "main",
+            draft=True,
+            description="Details",
+        )
+
+    @pytest.mark.asyncio
+    async def test_nested_kwargs_cannot_repeat_named_arguments(self):
+        """Test that nested copies of positional arguments are ignored."""
+        mock_create = AsyncMock(return_value={"id": "1"})
+        with patch(
+            "git_mcp.mcp_server.PlatformService.create_merge_request", mock_create
+        ):
+            await mcp_server.create_merge_request(
+                "gitlab",
+                "123",
+                "Fix bug",
+                "feature",
+                kwargs={"title": "Other", "target_branch": "dev", "draft": True},
+            )
+
+        mock_create.assert_awaited_once_with(
+            "gitlab", "123", "Fix bug", "feature", "main", draft=True
+        )